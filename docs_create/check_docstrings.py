@@ -9,7 +9,36 @@ import sys
 import ast
 import argparse
 import re
-from typing import Dict, List, Set, Tuple, Optional, Any
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from operator import attrgetter
+from typing import Callable, Dict, Iterable, List, Set, Tuple, Optional, Any
+
+# Directory names skipped during the walk unless overridden
+DEFAULT_IGNORE_DIRS = frozenset(['venv', 'env', '__pycache__', 'build', 'dist', '.git', '.github', 'tests'])
+
+# Docstring bodies that only stand in for real documentation
+_PLACEHOLDER_DOCS = frozenset(["TODO", "TODO:", "FIXME", "FIXME:", "..."])
+
+# Node types checked as functions or methods, matched by exact type
+_FUNCTION_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+# Headers that end an Args section, compiled once
+_SECTION_END_RE = re.compile(r'Returns:|Raises:|Yields:|Examples:')
+
+def _checker_digest() -> str:
+    """Hash the source of this checker, so cached results are discarded whenever it changes.
+
+    Returns:
+        Hex digest of this file, or an empty string if it cannot be read
+    """
+    try:
+        with open(__file__, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return ''
 
 # Configure colors for terminal output
 class Colors:
@@ -22,23 +51,193 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+def _new_statistics() -> Dict[str, int]:
+    """Create a zeroed statistics dictionary.
+
+    Returns:
+        Dictionary mapping each statistic name to 0
+    """
+    return {
+        'files_checked': 0,
+        'classes_checked': 0,
+        'methods_checked': 0,
+        'functions_checked': 0,
+        'missing_class_docstrings': 0,
+        'missing_method_docstrings': 0,
+        'missing_function_docstrings': 0,
+        'incomplete_docstrings': 0,
+    }
+
+def _check_docstring_completeness(docstring: str) -> bool:
+    """Check if a docstring is complete (has all sections).
+
+    Args:
+        docstring: The docstring to check
+
+    Returns:
+        True if the docstring is complete, False otherwise
+    """
+    if not docstring:
+        return False
+
+    # Check if docstring is just a placeholder
+    if docstring.strip() in _PLACEHOLDER_DOCS:
+        return False
+
+    # Check for Args section if there are parameters
+    # This is a simple heuristic and may not catch all cases
+    args_pos = docstring.find("Args:")
+    if args_pos < 0:
+        # This might be a simple docstring for a function without parameters
+        return True
+
+    # Check if Args section is empty
+    tail = docstring[args_pos + 5:]
+    section_end = _SECTION_END_RE.search(tail)
+    args_section = tail[:section_end.start()] if section_end else tail
+    if not args_section.strip():
+        return False
+
+    return True
+
+def _is_private(name: str) -> bool:
+    """Check if a name is private (starts with one underscore and is not a dunder).
+
+    Args:
+        name: The name to check
+
+    Returns:
+        True if the name is private, False otherwise
+    """
+    return name[:1] == '_' and name[:2] != '__' and name[-2:] != '__'
+
+def _check_file(file_path: str, ignore_private: bool, base_path: str, is_private: Callable[[str], bool] = _is_private) -> Tuple[List[Tuple[str, str, int]], List[Tuple[str, str, int]], Dict[str, int], List[str]]:
+    """Check a single Python file for docstrings.
+
+    Only module-level classes and functions, and methods defined directly in
+    those classes, are checked in a single pass over the module body; nested
+    classes and functions are skipped.
+
+    This does not touch any checker state, so it can run in a worker process.
+    Findings are recorded against the path relative to ``base_path``, which is
+    computed once per file rather than once per reported item.
+
+    Args:
+        file_path: Path to the Python file
+        ignore_private: Whether to skip private (underscore-prefixed) items
+        base_path: Directory that reported paths are made relative to
+        is_private: Predicate telling which names count as private
+
+    Returns:
+        Tuple of (missing, incomplete, statistics, errors) for the file
+    """
+    missing = []
+    incomplete = []
+    errors = []
+    rel_path = sys.intern(os.path.relpath(file_path, base_path))
+
+    # Count in locals and build the statistics dict once at the end
+    classes = methods = functions = 0
+    missing_classes = missing_methods = missing_functions = incomplete_count = 0
+
+    try:
+        # Read raw bytes and let the parser handle the PEP 263 encoding
+        with open(file_path, 'rb') as f:
+            source = f.read()
+
+        body = ast.parse(source, filename=file_path, type_comments=False).body
+
+        # Docstrings only live at module level and in class bodies, so
+        # walk those directly instead of visiting every node in the tree
+        for node in body:
+            node_type = type(node)
+
+            # Check for class definitions
+            if node_type is ast.ClassDef:
+                classes += 1
+
+                name = node.name
+                if ignore_private and is_private(name):
+                    continue
+
+                # Check class docstring
+                docstring = ast.get_docstring(node)
+                if not docstring:
+                    missing.append((rel_path, f"Class '{name}'", node.lineno))
+                    missing_classes += 1
+                elif not _check_docstring_completeness(docstring):
+                    incomplete.append((rel_path, f"Class '{name}'", node.lineno))
+                    incomplete_count += 1
+
+                # Shared by every method reported for this class
+                method_prefix = sys.intern(f"Method '{name}.")
+
+                # Check methods
+                for subnode in node.body:
+                    if type(subnode) in _FUNCTION_TYPES:
+                        methods += 1
+
+                        # Skip __special__ methods except __init__, and private
+                        # methods when requested
+                        name = subnode.name
+                        if name[:2] == '__' and name[-2:] == '__' and name != '__init__':
+                            continue
+                        if ignore_private and is_private(name):
+                            continue
+
+                        # Check method docstring
+                        docstring = ast.get_docstring(subnode)
+                        if not docstring:
+                            missing.append((rel_path, method_prefix + name + "'", subnode.lineno))
+                            missing_methods += 1
+                        elif not _check_docstring_completeness(docstring):
+                            incomplete.append((rel_path, method_prefix + name + "'", subnode.lineno))
+                            incomplete_count += 1
+
+            # Check for module-level function definitions
+            elif node_type in _FUNCTION_TYPES:
+                functions += 1
+
+                name = node.name
+                if ignore_private and is_private(name):
+                    continue
+
+                # Check function docstring
+                docstring = ast.get_docstring(node)
+                if not docstring:
+                    missing.append((rel_path, f"Function '{name}'", node.lineno))
+                    missing_functions += 1
+                elif not _check_docstring_completeness(docstring):
+                    incomplete.append((rel_path, f"Function '{name}'", node.lineno))
+                    incomplete_count += 1
+
+    except SyntaxError as e:
+        errors.append(f"Syntax error in {file_path}: {e}")
+    except Exception as e:
+        errors.append(f"Error processing {file_path}: {e}")
+
+    statistics = {
+        'files_checked': 1,
+        'classes_checked': classes,
+        'methods_checked': methods,
+        'functions_checked': functions,
+        'missing_class_docstrings': missing_classes,
+        'missing_method_docstrings': missing_methods,
+        'missing_function_docstrings': missing_functions,
+        'incomplete_docstrings': incomplete_count,
+    }
+    return missing, incomplete, statistics, errors
+
 class DocstringChecker:
-    def __init__(self, path: str, ignore_private: bool = True, ignore_dirs: Optional[List[str]] = None):
+    def __init__(self, path: str, ignore_private: bool = True, ignore_dirs: Optional[Iterable[str]] = None, jobs: Optional[int] = None, use_cache: bool = False):
         self.path = os.path.abspath(path)
         self.ignore_private = ignore_private
-        self.ignore_dirs = ignore_dirs or ['venv', 'env', '__pycache__', 'build', 'dist', '.git', '.github', 'tests']
+        self.ignore_dirs = frozenset(ignore_dirs or DEFAULT_IGNORE_DIRS)
+        self.jobs = jobs
+        self.use_cache = use_cache
         self.missing_docstrings = []
         self.incomplete_docstrings = []
-        self.statistics = {
-            'files_checked': 0,
-            'classes_checked': 0,
-            'methods_checked': 0,
-            'functions_checked': 0,
-            'missing_class_docstrings': 0,
-            'missing_method_docstrings': 0,
-            'missing_function_docstrings': 0,
-            'incomplete_docstrings': 0,
-        }
+        self.statistics = _new_statistics()
     
     def should_ignore_dir(self, dir_path: str) -> bool:
         """Check if a directory should be ignored.
@@ -49,8 +248,7 @@ class DocstringChecker:
         Returns:
             True if the directory should be ignored, False otherwise
         """
-        dir_name = os.path.basename(dir_path)
-        return dir_name in self.ignore_dirs
+        return os.path.basename(dir_path) in self.ignore_dirs
     
     def should_ignore_file(self, file_path: str) -> bool:
         """Check if a file should be ignored.
@@ -72,7 +270,7 @@ class DocstringChecker:
         Returns:
             True if the name is private, False otherwise
         """
-        return name.startswith('_') and not name.startswith('__') and not name.endswith('__')
+        return _is_private(name)
     
     def check_file(self, file_path: str) -> None:
         """Check a single Python file for docstrings.
@@ -80,182 +278,234 @@ class DocstringChecker:
         Args:
             file_path: Path to the Python file
         """
-        self.statistics['files_checked'] += 1
+        self.check_files([file_path])
+    
+    def check_files(self, file_paths: List[str]) -> None:
+        """Check several Python files, in parallel when possible.
         
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                source = f.read()
-            
-            tree = ast.parse(source)
-            
-            for node in ast.walk(tree):
-                # Check for class definitions
-                if isinstance(node, ast.ClassDef):
-                    self.statistics['classes_checked'] += 1
-                    
-                    if self.ignore_private and self.is_private(node.name):
-                        continue
-                    
-                    # Check class docstring
-                    if not ast.get_docstring(node):
-                        self.missing_docstrings.append((file_path, f"Class '{node.name}'", node.lineno))
-                        self.statistics['missing_class_docstrings'] += 1
-                    elif not self._check_docstring_completeness(ast.get_docstring(node)):
-                        self.incomplete_docstrings.append((file_path, f"Class '{node.name}'", node.lineno))
-                        self.statistics['incomplete_docstrings'] += 1
-                    
-                    # Check methods
-                    for subnode in node.body:
-                        if isinstance(subnode, ast.FunctionDef):
-                            self.statistics['methods_checked'] += 1
-                            
-                            if self.ignore_private and self.is_private(subnode.name):
-                                continue
-                            
-                            # Skip __special__ methods except __init__
-                            if subnode.name.startswith('__') and subnode.name.endswith('__') and subnode.name != '__init__':
-                                continue
-                            
-                            # Check method docstring
-                            if not ast.get_docstring(subnode):
-                                self.missing_docstrings.append((file_path, f"Method '{node.name}.{subnode.name}'", subnode.lineno))
-                                self.statistics['missing_method_docstrings'] += 1
-                            elif not self._check_docstring_completeness(ast.get_docstring(subnode)):
-                                self.incomplete_docstrings.append((file_path, f"Method '{node.name}.{subnode.name}'", subnode.lineno))
-                                self.statistics['incomplete_docstrings'] += 1
-                
-                # Check for function definitions
-                elif isinstance(node, ast.FunctionDef) and node.parent_field != 'body':
-                    self.statistics['functions_checked'] += 1
-                    
-                    if self.ignore_private and self.is_private(node.name):
-                        continue
-                    
-                    # Check function docstring
-                    if not ast.get_docstring(node):
-                        self.missing_docstrings.append((file_path, f"Function '{node.name}'", node.lineno))
-                        self.statistics['missing_function_docstrings'] += 1
-                    elif not self._check_docstring_completeness(ast.get_docstring(node)):
-                        self.incomplete_docstrings.append((file_path, f"Function '{node.name}'", node.lineno))
-                        self.statistics['incomplete_docstrings'] += 1
+        When caching is enabled, files whose modification time and size match
+        the on-disk cache reuse the cached findings. The rest are fanned out to a process pool unless
+        ``jobs`` is 1 or there is only one file. Results are merged in input
+        order, so the report is the same as for a serial run.
         
-        except SyntaxError as e:
-            print(f"{Colors.RED}Syntax error in {file_path}: {e}{Colors.ENDC}")
-        except Exception as e:
-            print(f"{Colors.RED}Error processing {file_path}: {e}{Colors.ENDC}")
+        Args:
+            file_paths: Paths to the Python files
+        """
+        cache = self._load_cache()
+        results = [None] * len(file_paths)
+        pending = []
+        keys = {}
+        for index, file_path in enumerate(file_paths):
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                pending.append(index)
+                continue
+            key = [stat.st_mtime_ns, stat.st_size]
+            entry = cache.get(file_path)
+            if entry is not None and entry[0] == key:
+                missing, incomplete, statistics = entry[1]
+                results[index] = ([tuple(item) for item in missing], [tuple(item) for item in incomplete], statistics, [])
+            else:
+                keys[file_path] = key
+                pending.append(index)
+        
+        for index, result in zip(pending, self._run_checks([file_paths[index] for index in pending])):
+            results[index] = result
+            file_path = file_paths[index]
+            # Files that failed to parse are re-checked (and re-reported) next time
+            if file_path in keys and not result[3]:
+                cache[file_path] = [keys[file_path], list(result[:3])]
+        
+        for result in results:
+            self._merge_result(result)
+        
+        if pending:
+            self._save_cache(cache)
     
-    def _check_docstring_completeness(self, docstring: str) -> bool:
-        """Check if a docstring is complete (has all sections).
+    def _run_checks(self, file_paths: List[str]) -> List[Tuple[List[Tuple[str, str, int]], List[Tuple[str, str, int]], Dict[str, int], List[str]]]:
+        """Run _check_file over the given files.
         
         Args:
-            docstring: The docstring to check
+            file_paths: Paths to the Python files
             
         Returns:
-            True if the docstring is complete, False otherwise
+            One _check_file result per file, in input order
         """
-        if not docstring:
-            return False
+        # Only ship the checker to the workers when a subclass overrides is_private
+        is_private = self.is_private if type(self).is_private is not DocstringChecker.is_private else _is_private
+        jobs = self.jobs or os.cpu_count() or 1
+        if jobs > 1 and len(file_paths) > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=jobs) as executor:
+                    return list(executor.map(_check_file, file_paths, repeat(self.ignore_private), repeat(self.path), repeat(is_private), chunksize=16))
+            except (OSError, NotImplementedError):
+                # No working process pool on this platform, check serially
+                pass
         
-        # Check if docstring is just a placeholder
-        if docstring.strip() in ["TODO", "TODO:", "FIXME", "FIXME:", "..."]:
-            return False
+        return [_check_file(file_path, self.ignore_private, self.path, is_private) for file_path in file_paths]
+    
+    def _cache_path(self) -> Optional[str]:
+        """Get the path of the results cache for this checker.
         
-        # Check for Args section if there are parameters
-        # This is a simple heuristic and may not catch all cases
-        if "Args:" not in docstring and "Parameters:" not in docstring:
-            # This might be a simple docstring for a function without parameters
-            return True
+        Returns:
+            Path to the cache file, or None if caching is disabled
+        """
+        if not self.use_cache:
+            return None
+        cache_root = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        # Keyed on the checker source too, so results from an older checker are never reused
+        checker_class = f"{type(self).__module__}.{type(self).__qualname__}"
+        digest = hashlib.sha1(f"{_checker_digest()}\0{checker_class}\0{self.path}\0{self.ignore_private}".encode('utf-8')).hexdigest()
+        return os.path.join(cache_root, 'docstring_check', f"{digest}.json")
+    
+    def _load_cache(self) -> Dict[str, Any]:
+        """Load cached per-file results.
         
-        # Check if Args section is empty
-        args_section = re.search(r'Args:(.*?)(?:Returns:|Raises:|Yields:|Examples:|$)', docstring, re.DOTALL)
-        if args_section and not args_section.group(1).strip():
-            return False
+        Returns:
+            Mapping of file path to [[mtime_ns, size], [missing, incomplete, statistics]]
+        """
+        cache_path = self._cache_path()
+        if cache_path is None:
+            return {}
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+    
+    def _save_cache(self, cache: Dict[str, Any]) -> None:
+        """Write cached per-file results, ignoring failures.
         
-        return True
+        Args:
+            cache: Mapping as returned by _load_cache
+        """
+        cache_path = self._cache_path()
+        if cache_path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+    
+    def _merge_result(self, result: Tuple[List[Tuple[str, str, int]], List[Tuple[str, str, int]], Dict[str, int], List[str]]) -> None:
+        """Merge the result of a single file check into the checker.
+        
+        Args:
+            result: Tuple returned by _check_file
+        """
+        missing, incomplete, statistics, errors = result
+        if errors:
+            color, endc = (Colors.RED, Colors.ENDC) if sys.stdout.isatty() else ('', '')
+            for message in errors:
+                print(f"{color}{message}{endc}")
+        self.missing_docstrings.extend(missing)
+        self.incomplete_docstrings.extend(incomplete)
+        for key, value in statistics.items():
+            self.statistics[key] += value
     
     def check_directory(self, dir_path: Optional[str] = None) -> None:
         """Recursively check all Python files in a directory.
         
+        The tree is walked with ``os.scandir`` and an explicit stack, so entry
+        types come from the directory listing instead of a ``stat`` per entry
+        and deep trees do not hit the recursion limit. Entries are visited in
+        name order, so the report does not depend on the filesystem's listing
+        order.
+        
         Args:
             dir_path: Path to the directory
         """
         if dir_path is None:
             dir_path = self.path
         
-        for item in os.listdir(dir_path):
-            item_path = os.path.join(dir_path, item)
-            
-            if os.path.isdir(item_path):
-                if not self.should_ignore_dir(item_path):
-                    self.check_directory(item_path)
-            elif os.path.isfile(item_path) and not self.should_ignore_file(item_path):
-                self.check_file(item_path)
+        should_ignore_dir = self.should_ignore_dir
+        should_ignore_file = self.should_ignore_file
+        file_paths = []
+        stack = [dir_path]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                subdirs = []
+                for entry in sorted(entries, key=attrgetter('name')):
+                    if entry.is_dir(follow_symlinks=False):
+                        if not should_ignore_dir(entry.path):
+                            subdirs.append(entry.path)
+                    elif not should_ignore_file(entry.path) and entry.is_file(follow_symlinks=False):
+                        file_paths.append(entry.path)
+            # Push in reverse so subdirectories are popped in name order
+            stack.extend(reversed(subdirs))
+        
+        self.check_files(file_paths)
     
     def print_results(self) -> None:
-        """Print the results of the docstring check."""
-        print(f"\n{Colors.HEADER}Docstring Check Results{Colors.ENDC}")
-        print(f"{Colors.BOLD}{'=' * 80}{Colors.ENDC}")
+        """Print the results of the docstring check.
         
-        # Print statistics
-        print(f"\n{Colors.BLUE}Statistics:{Colors.ENDC}")
-        print(f"  Files checked: {self.statistics['files_checked']}")
-        print(f"  Classes checked: {self.statistics['classes_checked']}")
-        print(f"  Methods checked: {self.statistics['methods_checked']}")
-        print(f"  Functions checked: {self.statistics['functions_checked']}")
+        The report is assembled as a list of lines and written with a single
+        ``writelines`` call. Colors are only emitted when stdout is a terminal.
+        """
+        if sys.stdout.isatty():
+            HEADER, BLUE, GREEN, YELLOW, RED, ENDC, BOLD = Colors.HEADER, Colors.BLUE, Colors.GREEN, Colors.YELLOW, Colors.RED, Colors.ENDC, Colors.BOLD
+        else:
+            HEADER = BLUE = GREEN = YELLOW = RED = ENDC = BOLD = ''
+        
+        statistics = self.statistics
+        rule = BOLD + '=' * 80 + ENDC + '\n'
+        lines = ['\n' + HEADER + 'Docstring Check Results' + ENDC + '\n', rule]
         
-        # Print missing docstrings
+        # Statistics
+        lines.append('\n' + BLUE + 'Statistics:' + ENDC + '\n')
+        lines.append('  Files checked: %d\n' % statistics['files_checked'])
+        lines.append('  Classes checked: %d\n' % statistics['classes_checked'])
+        lines.append('  Methods checked: %d\n' % statistics['methods_checked'])
+        lines.append('  Functions checked: %d\n' % statistics['functions_checked'])
+        
+        # Missing and incomplete docstrings
         if self.missing_docstrings:
-            print(f"\n{Colors.RED}Missing Docstrings:{Colors.ENDC}")
-            for file_path, item_name, line_no in self.missing_docstrings:
-                rel_path = os.path.relpath(file_path, self.path)
-                print(f"  {rel_path}:{line_no} - {item_name}")
+            lines.append('\n' + RED + 'Missing Docstrings:' + ENDC + '\n')
+            lines.extend(['  %s:%d - %s\n' % (rel_path, line_no, item_name) for rel_path, item_name, line_no in self.missing_docstrings])
         
-        # Print incomplete docstrings
         if self.incomplete_docstrings:
-            print(f"\n{Colors.YELLOW}Incomplete Docstrings:{Colors.ENDC}")
-            for file_path, item_name, line_no in self.incomplete_docstrings:
-                rel_path = os.path.relpath(file_path, self.path)
-                print(f"  {rel_path}:{line_no} - {item_name}")
+            lines.append('\n' + YELLOW + 'Incomplete Docstrings:' + ENDC + '\n')
+            lines.extend(['  %s:%d - %s\n' % (rel_path, line_no, item_name) for rel_path, item_name, line_no in self.incomplete_docstrings])
         
-        # Print summary
-        print(f"\n{Colors.BLUE}Summary:{Colors.ENDC}")
-        total_missing = sum([
-            self.statistics['missing_class_docstrings'],
-            self.statistics['missing_method_docstrings'],
-            self.statistics['missing_function_docstrings']
-        ])
-        total_items = sum([
-            self.statistics['classes_checked'],
-            self.statistics['methods_checked'],
-            self.statistics['functions_checked']
-        ])
+        # Summary
+        lines.append('\n' + BLUE + 'Summary:' + ENDC + '\n')
+        total_missing = statistics['missing_class_docstrings'] + statistics['missing_method_docstrings'] + statistics['missing_function_docstrings']
+        total_items = statistics['classes_checked'] + statistics['methods_checked'] + statistics['functions_checked']
         
         if total_items > 0:
             coverage = (total_items - total_missing) / total_items * 100
-            print(f"  Docstring coverage: {coverage:.1f}%")
+            lines.append('  Docstring coverage: %.1f%%\n' % coverage)
             
             if coverage >= 90:
-                status = f"{Colors.GREEN}Excellent{Colors.ENDC}"
+                status = GREEN + 'Excellent' + ENDC
             elif coverage >= 75:
-                status = f"{Colors.BLUE}Good{Colors.ENDC}"
+                status = BLUE + 'Good' + ENDC
             elif coverage >= 50:
-                status = f"{Colors.YELLOW}Needs Improvement{Colors.ENDC}"
+                status = YELLOW + 'Needs Improvement' + ENDC
             else:
-                status = f"{Colors.RED}Poor{Colors.ENDC}"
+                status = RED + 'Poor' + ENDC
             
-            print(f"  Documentation status: {status}")
+            lines.append('  Documentation status: ' + status + '\n')
         
-        print(f"{Colors.BOLD}{'=' * 80}{Colors.ENDC}")
+        lines.append(rule)
         
-        # Print calls to action
+        # Calls to action
         if self.missing_docstrings or self.incomplete_docstrings:
-            print(f"\n{Colors.YELLOW}Recommendations:{Colors.ENDC}")
-            print("  1. Add docstrings to all public classes, methods, and functions")
-            print("  2. Follow Google-style docstring format")
-            print("  3. Include Args, Returns, and Raises sections where appropriate")
-            print("  4. Use type annotations for all parameters and return values")
+            lines.append('\n' + YELLOW + 'Recommendations:' + ENDC + '\n')
+            lines.append('  1. Add docstrings to all public classes, methods, and functions\n')
+            lines.append('  2. Follow Google-style docstring format\n')
+            lines.append('  3. Include Args, Returns, and Raises sections where appropriate\n')
+            lines.append('  4. Use type annotations for all parameters and return values\n')
         else:
-            print(f"\n{Colors.GREEN}Great job! All code is properly documented.{Colors.ENDC}")
+            lines.append('\n' + GREEN + 'Great job! All code is properly documented.' + ENDC + '\n')
+        
+        sys.stdout.writelines(lines)
 
 def main():
     """Main entry point for the script."""
@@ -263,17 +513,21 @@ def main():
     parser.add_argument('path', nargs='?', default='.', help='Path to the directory or file to check')
     parser.add_argument('--include-private', action='store_true', help='Include private (underscore-prefixed) items')
     parser.add_argument('--ignore-dirs', nargs='+', help='Additional directories to ignore')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='Number of worker processes (default: CPU count, 1 checks serially)')
+    parser.add_argument('--cache', action='store_true', help='Reuse cached results for unchanged files (off by default, e.g. in CI)')
     
     args = parser.parse_args()
     
-    ignore_dirs = ['venv', 'env', '__pycache__', 'build', 'dist', '.git', '.github', 'tests']
+    ignore_dirs = set(DEFAULT_IGNORE_DIRS)
     if args.ignore_dirs:
-        ignore_dirs.extend(args.ignore_dirs)
+        ignore_dirs.update(args.ignore_dirs)
     
     checker = DocstringChecker(
         path=args.path,
         ignore_private=not args.include_private,
-        ignore_dirs=ignore_dirs
+        ignore_dirs=ignore_dirs,
+        jobs=args.jobs,
+        use_cache=args.cache
     )
     
     if os.path.isdir(args.path):
@@ -6,10 +6,17 @@ This script parses Python modules and classes to generate Markdown documentation
 
 import os
 import sys
+import argparse
+import functools
+import io
 import inspect
+import importlib
 import importlib.util
 import re
+import types
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from operator import itemgetter
 from typing import List, Dict, Any, Optional, Union, Tuple, Set
 
 # Configure logging
@@ -30,31 +37,102 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 logger.info(f"Generating API documentation in {OUTPUT_DIR}")
 
-# Import modules from the scheduler package
-try:
-    import scheduler
-    from scheduler.ax_scheduler import AxScheduler
-    from scheduler.trial.trial import Trial
-    from scheduler.job.job import Job
-    from scheduler.runners.base_runner import BaseRunner
-    from scheduler.runners.joblib_runner import JobLibRunner
-    from scheduler.runners.slurm_runner import SlurmRunner
-    try:
-        from scheduler.runners.pandaidds_runner import PanDAiDDSRunner
-        has_panda = True
-    except ImportError:
-        has_panda = False
-        logger.warning("PanDAiDDSRunner module not found, skipping documentation for this component")
-except ImportError as e:
-    logger.error(f"Error importing scheduler modules: {e}")
-    logger.error("Make sure the package is installed or in your PYTHONPATH")
-    sys.exit(1)
+# Classes to document as (module, class name, output file). The modules are
+# only imported when the documentation is generated, see _load_targets
+DOC_TARGETS = [
+    ("scheduler.ax_scheduler", "AxScheduler", "ax_scheduler.md"),
+    ("scheduler.trial.trial", "Trial", "trial.md"),
+    ("scheduler.job.job", "Job", "job.md"),
+    ("scheduler.runners.base_runner", "BaseRunner", "base_runner.md"),
+    ("scheduler.runners.joblib_runner", "JobLibRunner", "joblib_runner.md"),
+    ("scheduler.runners.slurm_runner", "SlurmRunner", "slurm_runner.md"),
+    ("scheduler.runners.pandaidds_runner", "PanDAiDDSRunner", "pandaidds_runner.md"),
+]
+PANDA_MODULE = "scheduler.runners.pandaidds_runner"
+
+# Source paths on GitHub for the documented modules, used in "Defined in" links
+GITHUB_PATHS = {module_name: module_name.replace('.', '/') for module_name, _, _ in DOC_TARGETS}
+RUNNER_CLASS_NAMES = ["BaseRunner", "JobLibRunner", "SlurmRunner", "PanDAiDDSRunner"]
+
+# Set by _load_targets once the PanDA runner module has been looked up
+has_panda = False
+
+# Regular expressions used while formatting docstrings and annotations
+_SECTION_RE = re.compile(r'^(\s*)(?:Args|Arguments|Parameters|Returns|Yields|Raises|Examples|Notes|Attributes|Warning|Warnings):(\s*)$')
+_HAS_SECTION_RE = re.compile(r'^\s*(?:Args|Arguments|Parameters|Returns|Yields|Raises|Examples|Notes|Attributes|Warning|Warnings):\s*$', re.MULTILINE)
+_PARAM_RE = re.compile(r'^\s*([a-zA-Z0-9_]+)(?:\s*\([a-zA-Z0-9_, ]+\))?\s*:\s*(.*)$')
+_UNION_NONE_RE = re.compile(r'Union\[(.*?), NoneType\]')
+_FORWARDREF_RE = re.compile(r'ForwardRef\(\'(.*?)\'\)')
+_SCHED_PREFIX_RE = re.compile(r'scheduler\.([a-zA-Z0-9_\.]+)\.([a-zA-Z0-9_]+)')
 
+# Markdown templates for the class pages, filled with str.format_map
+CLASS_HEADER_TMPL = "# {class_name}\n\n*Defined in [`{module_name}`](https://github.com/aid2e/scheduler_epic/blob/main/{module_path}.py)*\n\n{class_doc}\n\n"
+INHERITANCE_TMPL = "**Inherits from:** {base_names}\n\n"
+TOC_ROW_TMPL = "| [`{name}`](#{anchor}) | {description} |\n"
+METHOD_DETAIL_TMPL = "### {name}\n\n```python\ndef {name}({params}) -> {return_type}\n```\n\n{docstring}\n\n"
+
+def _write_doc(filename: str, parts: List[str]) -> None:
+    """Write a documentation file in one go.
+    
+    Generators collect their Markdown in a list of strings; the list is
+    joined, encoded as UTF-8 and written as bytes with a single call, with a
+    buffer large enough to bypass the text I/O layer's chunking.
+    
+    Args:
+        filename: Name of the file in OUTPUT_DIR to write
+        parts: Markdown fragments to concatenate
+    """
+    data = "".join(parts).encode("utf-8")
+    with open(os.path.join(OUTPUT_DIR, filename), 'wb', buffering=max(len(data), io.DEFAULT_BUFFER_SIZE)) as f:
+        f.write(data)
+
+def _flush_section(current_section: str, section_content: List[str], result: List[str]) -> None:
+    """Append a parsed docstring section to the formatted output.
+    
+    Parameter-style sections become a bullet list with one entry per name;
+    other sections are copied as indented lines.
+    
+    Args:
+        current_section: Name of the section (e.g. "Args")
+        section_content: Raw lines collected for the section
+        result: Formatted lines, extended in place
+    """
+    result.append(f"**{current_section}:**")
+    
+    # Format as a list if it's parameters
+    if current_section in ["Args", "Arguments", "Parameters", "Raises"]:
+        current_param = None
+        param_desc = []
+        
+        for content_line in section_content:
+            # Check if this is a parameter definition
+            param_match = _PARAM_RE.match(content_line)
+            if param_match:
+                # If we were describing a parameter, add it to the list
+                if current_param:
+                    result.append(f"* **{current_param}**: {' '.join(param_desc)}")
+                
+                # Start a new parameter
+                current_param = param_match.group(1)
+                param_desc = [param_match.group(2).strip()]
+            elif current_param and content_line.strip():
+                # Continue the description of the current parameter
+                param_desc.append(content_line.strip())
+        
+        # Add the last parameter
+        if current_param:
+            result.append(f"* **{current_param}**: {' '.join(param_desc)}")
+    else:
+        # For other sections, just add the content
+        result.extend([f"  {line.strip()}" for line in section_content if line.strip()])
+
+@functools.lru_cache(maxsize=512)
 def format_docstring(docstring: str) -> str:
     """Format docstring for Markdown output.
     
     This function cleans up docstrings and formats them for Markdown rendering,
-    handling Google-style and NumPy-style docstrings appropriately.
+    handling Google-style and NumPy-style docstrings appropriately. Results are
+    cached, since class docstrings are formatted for several output files.
     
     Args:
         docstring: The raw docstring from the Python object
@@ -78,6 +156,10 @@ def format_docstring(docstring: str) -> str:
         # Remove that amount of indentation from all lines
         lines = [lines[0]] + [line[min_indent:] if line.strip() else line for line in lines[1:]]
     
+    # Without any section headers only the non-empty lines are kept
+    if not _HAS_SECTION_RE.search(docstring):
+        return '\n'.join([line for line in lines if line.strip()])
+    
     # Process sections for Google-style docstrings
     result = []
     current_section = None
@@ -86,43 +168,12 @@ def format_docstring(docstring: str) -> str:
     
     for line in lines:
         # Check if this is a section header (Google style)
-        section_match = re.match(r'^(\s*)(?:Args|Arguments|Parameters|Returns|Yields|Raises|Examples|Notes|Attributes|Warning|Warnings):(\s*)$', line)
+        section_match = _SECTION_RE.match(line)
         
         if section_match:
             # If we were in a section, add its content to the result
             if current_section:
-                result.append(f"**{current_section}:**")
-                
-                # Format as a list if it's parameters
-                if current_section in ["Args", "Arguments", "Parameters", "Raises"]:
-                    param_list = []
-                    current_param = None
-                    param_desc = []
-                    
-                    for content_line in section_content:
-                        # Check if this is a parameter definition
-                        param_match = re.match(r'^\s*([a-zA-Z0-9_]+)(?:\s*\([a-zA-Z0-9_, ]+\))?\s*:\s*(.*)$', content_line)
-                        if param_match:
-                            # If we were describing a parameter, add it to the list
-                            if current_param:
-                                param_list.append(f"* **{current_param}**: {' '.join(param_desc)}")
-                            
-                            # Start a new parameter
-                            current_param = param_match.group(1)
-                            param_desc = [param_match.group(2).strip()]
-                        elif current_param and content_line.strip():
-                            # Continue the description of the current parameter
-                            param_desc.append(content_line.strip())
-                    
-                    # Add the last parameter
-                    if current_param:
-                        param_list.append(f"* **{current_param}**: {' '.join(param_desc)}")
-                    
-                    result.extend(param_list)
-                else:
-                    # For other sections, just add the content
-                    result.extend([f"  {line.strip()}" for line in section_content if line.strip()])
-                
+                _flush_section(current_section, section_content, result)
                 result.append("")  # Add a blank line after the section
             
             # Start a new section
@@ -139,37 +190,7 @@ def format_docstring(docstring: str) -> str:
     
     # Add the last section if there is one
     if current_section:
-        result.append(f"**{current_section}:**")
-        
-        # Format as a list if it's parameters
-        if current_section in ["Args", "Arguments", "Parameters", "Raises"]:
-            param_list = []
-            current_param = None
-            param_desc = []
-            
-            for content_line in section_content:
-                # Check if this is a parameter definition
-                param_match = re.match(r'^\s*([a-zA-Z0-9_]+)(?:\s*\([a-zA-Z0-9_, ]+\))?\s*:\s*(.*)$', content_line)
-                if param_match:
-                    # If we were describing a parameter, add it to the list
-                    if current_param:
-                        param_list.append(f"* **{current_param}**: {' '.join(param_desc)}")
-                    
-                    # Start a new parameter
-                    current_param = param_match.group(1)
-                    param_desc = [param_match.group(2).strip()]
-                elif current_param and content_line.strip():
-                    # Continue the description of the current parameter
-                    param_desc.append(content_line.strip())
-            
-            # Add the last parameter
-            if current_param:
-                param_list.append(f"* **{current_param}**: {' '.join(param_desc)}")
-            
-            result.extend(param_list)
-        else:
-            # For other sections, just add the content
-            result.extend([f"  {line.strip()}" for line in section_content if line.strip()])
+        _flush_section(current_section, section_content, result)
     
     # Join the result into a single string
     return '\n'.join(result)
@@ -189,34 +210,95 @@ def format_type_annotation(annotation) -> str:
     if annotation is inspect.Parameter.empty:
         return "Any"
     
-    # Convert to string
-    anno_str = str(annotation)
+    return _format_annotation_str(str(annotation))
+
+@functools.lru_cache(maxsize=1024)
+def _format_annotation_str(anno_str: str) -> str:
+    """Clean up the string form of a type annotation.
+    
+    Cached because the same annotations recur across many methods.
     
+    Args:
+        anno_str: The annotation converted with str()
+        
+    Returns:
+        A string representation of the type annotation
+    """
     # Clean up typing annotations
     anno_str = anno_str.replace('typing.', '')
     anno_str = anno_str.replace('NoneType', 'None')
     
     # Handle common typing generics
-    anno_str = re.sub(r'Union\[(.*?), NoneType\]', r'Optional[\1]', anno_str)
-    anno_str = re.sub(r'ForwardRef\(\'(.*?)\'\)', r'\1', anno_str)
+    anno_str = _UNION_NONE_RE.sub(r'Optional[\1]', anno_str)
+    anno_str = _FORWARDREF_RE.sub(r'\1', anno_str)
     
     # Handle self-references with full module path
-    anno_str = re.sub(r'scheduler\.([a-zA-Z0-9_\.]+)\.([a-zA-Z0-9_]+)', r'\2', anno_str)
+    anno_str = _SCHED_PREFIX_RE.sub(r'\2', anno_str)
     
     return anno_str
 
-def get_class_methods(cls) -> List[Dict[str, Any]]:
-    """Extract methods from a class."""
+@functools.lru_cache(maxsize=None)
+def _get_signature(func) -> inspect.Signature:
+    """Get the signature of a function, cached per function object.
+    
+    Inherited methods are documented once per subclass, so the same function
+    objects are inspected repeatedly.
+    
+    Args:
+        func: The function to inspect
+        
+    Returns:
+        The function's signature
+    """
+    return inspect.signature(func)
+
+def _iter_class_functions(cls):
+    """Yield the plain functions visible on a class, including inherited ones.
+    
+    Walks each class ``__dict__`` along the MRO instead of calling ``getattr``
+    on every attribute name, resolving each name to its first definition like
+    attribute lookup does.
+    
+    Args:
+        cls: The class to inspect
+        
+    Yields:
+        Tuples of (name, function)
+    """
+    seen = set()
+    for klass in cls.__mro__:
+        if klass is object:
+            continue
+        for name, obj in vars(klass).items():
+            if name in seen:
+                continue
+            seen.add(name)
+            if isinstance(obj, staticmethod):
+                obj = obj.__func__
+            if isinstance(obj, types.FunctionType):
+                yield name, obj
+
+def get_class_methods(cls) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Extract methods from a class.
+    
+    Args:
+        cls: The class to inspect
+        
+    Returns:
+        Tuple of the ``__init__`` method (or None) and the other public
+        methods sorted by name
+    """
+    init_method = None
     methods = []
     
     # Get all methods including inherited ones
-    for name, method in inspect.getmembers(cls, predicate=inspect.isfunction):
+    for name, method in _iter_class_functions(cls):
         # Skip private methods except __init__
         if name.startswith('_') and name != '__init__':
             continue
         
-        docstring = inspect.getdoc(method) or "*No documentation available.*"
-        signature = inspect.signature(method)
+        docstring = inspect.getdoc(method)
+        signature = _get_signature(method)
         
         # Format parameters
         formatted_params = []
@@ -232,128 +314,188 @@ def get_class_methods(cls) -> List[Dict[str, Any]]:
         # Format return annotation
         return_annotation = format_type_annotation(signature.return_annotation)
         
-        methods.append({
+        method_info = {
             'name': name,
             'params': formatted_params,
             'return_type': return_annotation,
-            'docstring': format_docstring(docstring)
-        })
+            'docstring': format_docstring(docstring) if docstring else "*No documentation available.*"
+        }
+        if name == '__init__':
+            init_method = method_info
+        else:
+            methods.append(method_info)
     
-    return sorted(methods, key=lambda m: (m['name'] != '__init__', m['name']))
+    return init_method, sorted(methods, key=itemgetter('name'))
 
-def generate_class_doc(cls, filename: str) -> None:
+def get_class_info(cls) -> Dict[str, Any]:
+    """Introspect a class once for all documentation generators.
+    
+    Args:
+        cls: The class to inspect
+        
+    Returns:
+        Dictionary with the raw docstring ('raw_doc'), the formatted
+        docstring ('doc'), the constructor ('init_method') and the other
+        documented methods ('methods')
+    """
+    raw_doc = inspect.getdoc(cls) or "*No documentation available.*"
+    init_method, methods = get_class_methods(cls)
+    return {
+        'raw_doc': raw_doc,
+        'doc': format_docstring(raw_doc),
+        'init_method': init_method,
+        'methods': methods,
+    }
+
+def generate_class_doc(cls, filename: str, info: Optional[Dict[str, Any]] = None) -> None:
     """Generate documentation for a class.
     
     Args:
         cls: The class to document
         filename: The filename to write the documentation to
+        info: Precomputed result of get_class_info for the class
     """
+    if info is None:
+        info = get_class_info(cls)
     class_name = cls.__name__
     module_name = cls.__module__
-    class_doc = format_docstring(inspect.getdoc(cls) or "*No documentation available.*")
-    methods = get_class_methods(cls)
+    class_doc = info['doc']
+    init_method = info['init_method']
+    methods = info['methods']
     
     logger.info(f"Generating documentation for {module_name}.{class_name}")
     
-    with open(os.path.join(OUTPUT_DIR, filename), 'w') as f:
-        f.write(f"# {class_name}\n\n")
-        
-        # Module information
-        f.write(f"*Defined in [`{module_name}`](https://github.com/aid2e/scheduler_epic/blob/main/{module_name.replace('.', '/')}.py)*\n\n")
-        
-        # Class description
-        f.write(f"{class_doc}\n\n")
-        
-        # Class inheritance
-        base_classes = cls.__bases__
-        if base_classes and base_classes[0] != object:
-            base_names = []
-            for base in base_classes:
-                if base.__module__.startswith('scheduler'):
-                    # base_names.append(f"[{base.__name__}]({base.__name__.lower()}.md)")
-                    base_names.append(f"[{base.__name__}]({base.__module__.split(".")[-1].lower()}.md)")
-                else:
-                    base_names.append(base.__name__)
-            
-            f.write(f"**Inherits from:** {', '.join(base_names)}\n\n")
-        
-        # Class definition
-        f.write("## Class Definition\n\n")
-        f.write("```python\n")
-        
-        # Get init method signature
-        init_method = next((m for m in methods if m['name'] == '__init__'), None)
-        if init_method:
-            params_str = ", ".join(["self"] + init_method['params'])
-            f.write(f"class {class_name}({params_str}):\n")
-            # Add init docstring indented
-            if init_method['docstring'] != "*No documentation available.*":
-                docstring_lines = init_method['docstring'].split('\n')
-                f.write(f"    \"\"\"\n")
-                for line in docstring_lines:
-                    f.write(f"    {line}\n")
-                f.write(f"    \"\"\"\n")
+    # Title, module information and class description
+    parts = [CLASS_HEADER_TMPL.format_map({
+        'class_name': class_name,
+        'module_name': module_name,
+        'module_path': GITHUB_PATHS.get(module_name) or module_name.replace('.', '/'),
+        'class_doc': class_doc,
+    })]
+    
+    # Class inheritance
+    base_classes = cls.__bases__
+    if base_classes and base_classes[0] != object:
+        base_names = []
+        for base in base_classes:
+            if base.__module__.startswith('scheduler'):
+                # base_names.append(f"[{base.__name__}]({base.__name__.lower()}.md)")
+                base_names.append(f"[{base.__name__}]({base.__module__.split('.')[-1].lower()}.md)")
             else:
-                f.write(f"    # No documentation available for constructor\n")
+                base_names.append(base.__name__)
+        
+        parts.append(INHERITANCE_TMPL.format_map({'base_names': ', '.join(base_names)}))
+    
+    # Class definition
+    parts.append("## Class Definition\n\n")
+    parts.append("```python\n")
+    
+    # Constructor signature
+    if init_method:
+        params_str = ", ".join(["self"] + init_method['params'])
+        parts.append(f"class {class_name}({params_str}):\n")
+        # Add init docstring indented
+        if init_method['docstring'] != "*No documentation available.*":
+            docstring_lines = init_method['docstring'].split('\n')
+            parts.append(f"    \"\"\"\n")
+            for line in docstring_lines:
+                parts.append(f"    {line}\n")
+            parts.append(f"    \"\"\"\n")
         else:
-            f.write(f"class {class_name}:\n")
-            f.write(f"    # No constructor documentation available\n")
-            
-        f.write("```\n\n")
-        
-        # Create a Table of Contents for methods
-        if len(methods) > 1:  # More than just __init__
-            f.write("## Methods\n\n")
-            f.write("| Method | Description |\n")
-            f.write("|--------|-------------|\n")
-            
-            for method in methods:
-                if method['name'] == '__init__':
-                    continue
-                
-                # Get the first line of the docstring for the description
-                description = method['docstring'].split('\n')[0]
-                if description == "*No documentation available.*":
-                    description = ""
-                
-                f.write(f"| [`{method['name']}`](#{method['name'].lower()}) | {description} |\n")
-            
-            f.write("\n")
+            parts.append(f"    # No documentation available for constructor\n")
+    else:
+        parts.append(f"class {class_name}:\n")
+        parts.append(f"    # No constructor documentation available\n")
+        
+    parts.append("```\n\n")
+    
+    # Table of Contents and detailed documentation, built in one pass
+    toc_parts = []
+    detail_parts = []
+    last_method = methods[-1] if methods else None
+    for method in methods:
+        # Get the first line of the docstring for the description
+        description = method['docstring'].split('\n')[0]
+        if description == "*No documentation available.*":
+            description = ""
+        
+        name = method['name']
+        toc_parts.append(TOC_ROW_TMPL.format_map({'name': name, 'anchor': name.lower(), 'description': description}))
+        
+        # Signature and docstring
+        detail_parts.append(METHOD_DETAIL_TMPL.format_map({
+            'name': name,
+            'params': ", ".join(["self"] + method['params']),
+            'return_type': method['return_type'],
+            'docstring': method['docstring'],
+        }))
         
-        # Methods section with detailed documentation
-        f.write("## Method Details\n\n")
-        for method in methods:
-            # Skip __init__ as it's already documented
-            if method['name'] == '__init__':
-                continue
-                
-            f.write(f"### {method['name']}\n\n")
-            f.write("```python\n")
-            
-            params_str = ", ".join(["self"] + method['params'])
-            f.write(f"def {method['name']}({params_str}) -> {method['return_type']}\n")
-            f.write("```\n\n")
-            
-            # Add the docstring
-            f.write(f"{method['docstring']}\n\n")
-            
-            # Add a separator between methods
-            if method != methods[-1] and method['name'] != '__init__':
-                f.write("---\n\n")
+        # Add a separator between methods
+        if method is not last_method:
+            detail_parts.append("---\n\n")
+    
+    if methods:
+        parts.append("## Methods\n\n")
+        parts.append("| Method | Description |\n")
+        parts.append("|--------|-------------|\n")
+        parts.extend(toc_parts)
+        parts.append("\n")
+    
+    parts.append("## Method Details\n\n")
+    parts.extend(detail_parts)
+    
+    _write_doc(filename, parts)
     
     logger.info(f"Documentation for {class_name} written to {filename}")
     
     # Return the path to the generated file
     return os.path.join(OUTPUT_DIR, filename)
 
+def _generate_class_docs(targets: List[Tuple[type, str]], class_info: Dict[type, Dict[str, Any]]) -> List[str]:
+    """Generate the documentation pages for several classes in parallel.
+    
+    Pages are written from a process pool; where processes cannot be started
+    a thread pool is used instead.
+    
+    Args:
+        targets: Pairs of (class, filename) to document
+        class_info: Mapping of class to its get_class_info result
+        
+    Returns:
+        Paths of the generated files, in the order of targets
+    """
+    try:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = [executor.submit(generate_class_doc, cls, filename, class_info[cls]) for cls, filename in targets]
+            return [future.result() for future in futures]
+    except (OSError, NotImplementedError):
+        logger.warning("Process pool unavailable, generating class documentation in threads")
+    
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [executor.submit(generate_class_doc, cls, filename, class_info[cls]) for cls, filename in targets]
+        return [future.result() for future in futures]
+
 def generate_module_overview(module_path: str, filename: str) -> None:
     """Generate overview documentation for a module."""
     module_name = os.path.basename(module_path).replace('.py', '')
     
-    # Import the module
-    spec = importlib.util.spec_from_file_location(module_name, module_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    # Reuse the already imported module where possible; executing the file
+    # again would repeat its import-time work and side effects
+    module = None
+    rel_path = os.path.relpath(os.path.abspath(module_path), project_root)
+    if not rel_path.startswith(os.pardir):
+        dotted_name = os.path.splitext(rel_path)[0].replace(os.sep, '.')
+        if dotted_name.endswith('.__init__'):
+            dotted_name = dotted_name[:-len('.__init__')]
+        try:
+            module = sys.modules.get(dotted_name) or importlib.import_module(dotted_name)
+        except ImportError:
+            module = None
+    
+    if module is None:
+        spec = importlib.util.spec_from_file_location(module_name, module_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
     
     module_doc = format_docstring(inspect.getdoc(module) or "*No module documentation available.*")
     
@@ -363,125 +505,181 @@ def generate_module_overview(module_path: str, filename: str) -> None:
         if inspect.isclass(obj) and obj.__module__ == module.__name__:
             classes.append(obj)
     
-    with open(os.path.join(OUTPUT_DIR, filename), 'w') as f:
-        f.write(f"# {module_name.capitalize()} Module\n\n")
-        f.write(f"{module_doc}\n\n")
-        
-        if classes:
-            f.write("## Classes\n\n")
-            for cls in classes:
-                cls_doc = format_docstring(inspect.getdoc(cls) or "*No documentation available.*")
-                # Take just the first paragraph for the overview
-                first_paragraph = cls_doc.split('\n\n')[0]
-                f.write(f"### [{cls.__name__}]({cls.__name__.lower()}.md)\n\n")
-                f.write(f"{first_paragraph}\n\n")
+    parts = []
+    parts.append(f"# {module_name.capitalize()} Module\n\n")
+    parts.append(f"{module_doc}\n\n")
+    
+    if classes:
+        parts.append("## Classes\n\n")
+        for cls in classes:
+            cls_doc = format_docstring(inspect.getdoc(cls) or "*No documentation available.*")
+            # Take just the first paragraph for the overview
+            first_paragraph = cls_doc.split('\n\n')[0]
+            parts.append(f"### [{cls.__name__}]({cls.__name__.lower()}.md)\n\n")
+            parts.append(f"{first_paragraph}\n\n")
+    
+    _write_doc(filename, parts)
 
 def generate_index_page():
     """Generate the API index page with links to all documented classes."""
     logger.info("Generating API index page")
     
-    with open(os.path.join(OUTPUT_DIR, "index.md"), 'w') as f:
-        f.write("# API Reference\n\n")
-        f.write("This section provides detailed API documentation for the scheduler package.\n\n")
-        
-        # Add search box info
-        f.write("> **Tip:** Use the search box in the top navigation bar to quickly find specific classes or methods.\n\n")
-        
-        # Core Components section
-        f.write("## Core Components\n\n")
-        
-        # AxScheduler
-        f.write("### [AxScheduler](ax_scheduler.md)\n\n")
-        f.write("The main entry point for using the Scheduler library. It integrates with Ax for optimization and manages the execution of trials.\n\n")
-        f.write("```python\n")
-        f.write("# Example usage\n")
-        f.write("from scheduler import AxScheduler, JobLibRunner\n")
-        f.write("from ax.service.ax_client import AxClient\n\n")
-        f.write("ax_client = AxClient()\n")
-        f.write("# Set up parameters...\n\n")
-        f.write("runner = JobLibRunner()\n")
-        f.write("scheduler = AxScheduler(ax_client, runner)\n")
-        f.write("scheduler.set_objective_function(my_objective_function)\n")
-        f.write("best_params = scheduler.run_optimization(max_trials=10)\n")
-        f.write("```\n\n")
-        
-        # Trial
-        f.write("### [Trial](trial.md)\n\n")
-        f.write("Represents a single optimization trial with parameters and jobs.\n\n")
-        
-        # Job
-        f.write("### [Job](job.md)\n\n")
-        f.write("Represents a single computational job that executes code with specific parameters.\n\n")
-        
-        # Runners section
-        f.write("## Runners\n\n")
-        f.write("Runners are responsible for executing jobs on different computing backends.\n\n")
-        
-        f.write("### [BaseRunner](base_runner.md)\n\n")
-        f.write("The abstract base class that defines the interface for all runners.\n\n")
-        
-        f.write("### [JobLibRunner](joblib_runner.md)\n\n")
-        f.write("Runner for local parallel execution using JobLib.\n\n")
-        
-        f.write("### [SlurmRunner](slurm_runner.md)\n\n")
-        f.write("Runner for execution on Slurm clusters.\n\n")
-        
-        if has_panda:
-            f.write("### [PanDAiDDSRunner](pandaidds_runner.md)\n\n")
-            f.write("Runner for execution using PanDA distributed computing.\n\n")
-        
-        # Class Hierarchy section
-        f.write("## Class Hierarchy\n\n")
-        f.write("```\n")
-        f.write("BaseRunner\n")
-        f.write("├── JobLibRunner\n")
-        f.write("├── SlurmRunner\n")
-        if has_panda:
-            f.write("└── PanDAiDDSRunner\n")
-        f.write("```\n\n")
-        
-        # Add a "How to Use This Documentation" section
-        f.write("## How to Use This Documentation\n\n")
-        f.write("Each class documentation page includes:\n\n")
-        f.write("1. **Class Description** - Overview of the class's purpose\n")
-        f.write("2. **Class Definition** - The constructor signature and parameters\n")
-        f.write("3. **Methods Table** - Quick reference of all available methods\n")
-        f.write("4. **Method Details** - Detailed documentation for each method\n\n")
-        
-        f.write("The documentation is automatically generated from docstrings in the source code.\n")
+    parts = []
+    parts.append("# API Reference\n\n")
+    parts.append("This section provides detailed API documentation for the scheduler package.\n\n")
+    
+    # Add search box info
+    parts.append("> **Tip:** Use the search box in the top navigation bar to quickly find specific classes or methods.\n\n")
+    
+    # Core Components section
+    parts.append("## Core Components\n\n")
+    
+    # AxScheduler
+    parts.append("### [AxScheduler](ax_scheduler.md)\n\n")
+    parts.append("The main entry point for using the Scheduler library. It integrates with Ax for optimization and manages the execution of trials.\n\n")
+    parts.append("```python\n")
+    parts.append("# Example usage\n")
+    parts.append("from scheduler import AxScheduler, JobLibRunner\n")
+    parts.append("from ax.service.ax_client import AxClient\n\n")
+    parts.append("ax_client = AxClient()\n")
+    parts.append("# Set up parameters...\n\n")
+    parts.append("runner = JobLibRunner()\n")
+    parts.append("scheduler = AxScheduler(ax_client, runner)\n")
+    parts.append("scheduler.set_objective_function(my_objective_function)\n")
+    parts.append("best_params = scheduler.run_optimization(max_trials=10)\n")
+    parts.append("```\n\n")
+    
+    # Trial
+    parts.append("### [Trial](trial.md)\n\n")
+    parts.append("Represents a single optimization trial with parameters and jobs.\n\n")
+    
+    # Job
+    parts.append("### [Job](job.md)\n\n")
+    parts.append("Represents a single computational job that executes code with specific parameters.\n\n")
+    
+    # Runners section
+    parts.append("## Runners\n\n")
+    parts.append("Runners are responsible for executing jobs on different computing backends.\n\n")
+    
+    parts.append("### [BaseRunner](base_runner.md)\n\n")
+    parts.append("The abstract base class that defines the interface for all runners.\n\n")
+    
+    parts.append("### [JobLibRunner](joblib_runner.md)\n\n")
+    parts.append("Runner for local parallel execution using JobLib.\n\n")
+    
+    parts.append("### [SlurmRunner](slurm_runner.md)\n\n")
+    parts.append("Runner for execution on Slurm clusters.\n\n")
+    
+    if has_panda:
+        parts.append("### [PanDAiDDSRunner](pandaidds_runner.md)\n\n")
+        parts.append("Runner for execution using PanDA distributed computing.\n\n")
+    
+    # Class Hierarchy section
+    parts.append("## Class Hierarchy\n\n")
+    parts.append("```\n")
+    parts.append("BaseRunner\n")
+    parts.append("├── JobLibRunner\n")
+    parts.append("├── SlurmRunner\n")
+    if has_panda:
+        parts.append("└── PanDAiDDSRunner\n")
+    parts.append("```\n\n")
+    
+    # Add a "How to Use This Documentation" section
+    parts.append("## How to Use This Documentation\n\n")
+    parts.append("Each class documentation page includes:\n\n")
+    parts.append("1. **Class Description** - Overview of the class's purpose\n")
+    parts.append("2. **Class Definition** - The constructor signature and parameters\n")
+    parts.append("3. **Methods Table** - Quick reference of all available methods\n")
+    parts.append("4. **Method Details** - Detailed documentation for each method\n\n")
+    
+    parts.append("The documentation is automatically generated from docstrings in the source code.\n")
+    
+    _write_doc("index.md", parts)
     
     logger.info("API index page generated successfully")
 
-def main():
-    """Main entry point for the script."""
+def _load_targets(only: Optional[List[str]] = None) -> List[Tuple[type, str]]:
+    """Import the classes to document.
+    
+    Modules are imported here rather than at the top of the script, and only
+    for the requested classes. The PanDA runner is skipped if its module
+    cannot be found or imported.
+    
+    Args:
+        only: Class names to restrict the import to, or None for all classes
+        
+    Returns:
+        Pairs of (class, filename) in documentation order
+        
+    Raises:
+        ImportError: If one of the scheduler modules cannot be imported
+    """
+    global has_panda
+    
+    targets = []
+    for module_name, class_name, filename in DOC_TARGETS:
+        if only is not None and class_name not in only:
+            continue
+        
+        if module_name == PANDA_MODULE:
+            try:
+                found = importlib.util.find_spec(module_name) is not None
+                module = importlib.import_module(module_name) if found else None
+            except ImportError:
+                module = None
+            has_panda = module is not None
+            if not has_panda:
+                logger.warning("PanDAiDDSRunner module not found, skipping documentation for this component")
+                continue
+        else:
+            module = importlib.import_module(module_name)
+        
+        targets.append((getattr(module, class_name), filename))
+    
+    return targets
+
+def main(argv: Optional[List[str]] = None):
+    """Main entry point for the script.
+    
+    Args:
+        argv: Command line arguments, defaults to sys.argv[1:]
+    """
+    parser = argparse.ArgumentParser(description='Generate API documentation for the scheduler package')
+    parser.add_argument('--only', nargs='+', metavar='CLASS', choices=[class_name for _, class_name, _ in DOC_TARGETS],
+                        help='Only generate the pages for these classes (skips the index and combined pages)')
+    args = parser.parse_args(argv)
+    
     logger.info("Starting API documentation generation")
     
     # Create a list to track generated files
     generated_files = []
     
     try:
-        # Generate documentation for core classes
-        generated_files.append(generate_class_doc(AxScheduler, "ax_scheduler.md"))
-        generated_files.append(generate_class_doc(Trial, "trial.md"))
-        generated_files.append(generate_class_doc(Job, "job.md"))
-        
-        # Generate documentation for runner classes
-        generated_files.append(generate_class_doc(BaseRunner, "base_runner.md"))
-        generated_files.append(generate_class_doc(JobLibRunner, "joblib_runner.md"))
-        generated_files.append(generate_class_doc(SlurmRunner, "slurm_runner.md"))
-        if has_panda:
-            generated_files.append(generate_class_doc(PanDAiDDSRunner, "pandaidds_runner.md"))
-        
-        # Generate index page
-        generate_index_page()
-        
-        # Generate a combined markdown file for all runners
-        generate_combined_doc(
-            "runners.md",
-            "Runners",
-            "Runners are responsible for executing jobs on different computing backends.",
-            [BaseRunner, JobLibRunner, SlurmRunner] + ([PanDAiDDSRunner] if has_panda else [])
-        )
+        try:
+            targets = _load_targets(args.only)
+        except ImportError as e:
+            logger.error(f"Error importing scheduler modules: {e}")
+            logger.error("Make sure the package is installed or in your PYTHONPATH")
+            return 1
+        
+        # Introspect each class once and share the result between generators
+        class_info = {cls: get_class_info(cls) for cls, _ in targets}
+        
+        # Class pages are independent, so write them in worker processes
+        generated_files.extend(_generate_class_docs(targets, class_info))
+        
+        if args.only is None:
+            # Generate index page
+            generate_index_page()
+            
+            # Generate a combined markdown file for all runners
+            generate_combined_doc(
+                "runners.md",
+                "Runners",
+                "Runners are responsible for executing jobs on different computing backends.",
+                [cls for cls, _ in targets if cls.__name__ in RUNNER_CLASS_NAMES],
+                class_info
+            )
         
         logger.info(f"API documentation generation complete")
         logger.info(f"Generated {len(generated_files)} documentation files")
@@ -491,7 +689,7 @@ def main():
         logger.error(f"Error generating API documentation: {e}", exc_info=True)
         return 1
 
-def generate_combined_doc(filename, title, description, classes):
+def generate_combined_doc(filename, title, description, classes, class_info=None):
     """Generate a combined documentation file for multiple related classes.
     
     Args:
@@ -499,66 +697,73 @@ def generate_combined_doc(filename, title, description, classes):
         title: The title of the combined documentation
         description: The description of the combined documentation
         classes: A list of classes to include
+        class_info: Mapping of class to its get_class_info result, used
+            instead of re-inspecting the classes when given
     """
     logger.info(f"Generating combined documentation for {title}")
     
-    with open(os.path.join(OUTPUT_DIR, filename), 'w') as f:
-        f.write(f"# {title}\n\n")
-        f.write(f"{description}\n\n")
-        
-        # Add links to individual class documentation
-        f.write("## Classes\n\n")
-        for cls in classes:
-            class_name = cls.__name__
+    parts = []
+    parts.append(f"# {title}\n\n")
+    parts.append(f"{description}\n\n")
+    
+    # Add links to individual class documentation
+    parts.append("## Classes\n\n")
+    for cls in classes:
+        class_name = cls.__name__
+        if class_info and cls in class_info:
+            class_doc = class_info[cls]['raw_doc']
+        else:
             class_doc = inspect.getdoc(cls) or "*No documentation available.*"
-            first_line = class_doc.split('\n')[0]
-            
-            # f.write(f"### [{class_name}]({class_name.lower()}.md)\n\n")
-            f.write(f"### [{class_name}]({cls.__module__.split(".")[-1].lower()}.md)\n\n")
-            f.write(f"{first_line}\n\n")
-        
-        # Add class inheritance diagram
-        f.write("## Class Hierarchy\n\n")
-        f.write("```\n")
-        
-        # Find base classes (classes that don't inherit from other classes in our list)
-        base_classes = []
-        for c in classes:
-            # Check if the first base class is in our classes list
-            if len(c.__bases__) > 0 and c.__bases__[0] not in classes:
-                base_classes.append(c)
-        
-        for base_class in base_classes:
-            f.write(f"{base_class.__name__}\n")
-            
-            # Find direct subclasses
-            subclasses = [c for c in classes if len(c.__bases__) > 0 and c.__bases__[0] == base_class]
-            for i, subclass in enumerate(subclasses):
-                prefix = "└── " if i == len(subclasses) - 1 else "├── "
-                f.write(f"{prefix}{subclass.__name__}\n")
-        
-        f.write("```\n\n")
-        
-        # Add common usage examples if available
-        f.write("## Usage Examples\n\n")
-        
-        f.write("```python\n")
-        if title == "Runners":
-            f.write("# Using JobLibRunner for local parallel execution\n")
-            f.write("from scheduler import AxScheduler, JobLibRunner\n")
-            f.write("from ax.service.ax_client import AxClient\n\n")
-            f.write("runner = JobLibRunner(n_jobs=4)  # Use 4 parallel processes\n")
-            f.write("scheduler = AxScheduler(ax_client, runner)\n\n")
-            
-            f.write("# Using SlurmRunner for cluster execution\n")
-            f.write("from scheduler import SlurmRunner\n\n")
-            f.write("runner = SlurmRunner(\n")
-            f.write("    partition='compute',\n")
-            f.write("    time='1:00:00',\n")
-            f.write("    memory='4G'\n")
-            f.write(")\n")
-            f.write("scheduler = AxScheduler(ax_client, runner)\n")
-        f.write("```\n\n")
+        first_line = class_doc.split('\n')[0]
+        
+        # parts.append(f"### [{class_name}]({class_name.lower()}.md)\n\n")
+        parts.append(f"### [{class_name}]({cls.__module__.split('.')[-1].lower()}.md)\n\n")
+        parts.append(f"{first_line}\n\n")
+    
+    # Add class inheritance diagram
+    parts.append("## Class Hierarchy\n\n")
+    parts.append("```\n")
+    
+    # Find base classes (classes that don't inherit from other classes in our list)
+    base_classes = []
+    for c in classes:
+        # Check if the first base class is in our classes list
+        if len(c.__bases__) > 0 and c.__bases__[0] not in classes:
+            base_classes.append(c)
+    
+    for base_class in base_classes:
+        parts.append(f"{base_class.__name__}\n")
+        
+        # Find direct subclasses
+        subclasses = [c for c in classes if len(c.__bases__) > 0 and c.__bases__[0] == base_class]
+        for i, subclass in enumerate(subclasses):
+            prefix = "└── " if i == len(subclasses) - 1 else "├── "
+            parts.append(f"{prefix}{subclass.__name__}\n")
+    
+    parts.append("```\n\n")
+    
+    # Add common usage examples if available
+    parts.append("## Usage Examples\n\n")
+    
+    parts.append("```python\n")
+    if title == "Runners":
+        parts.append("# Using JobLibRunner for local parallel execution\n")
+        parts.append("from scheduler import AxScheduler, JobLibRunner\n")
+        parts.append("from ax.service.ax_client import AxClient\n\n")
+        parts.append("runner = JobLibRunner(n_jobs=4)  # Use 4 parallel processes\n")
+        parts.append("scheduler = AxScheduler(ax_client, runner)\n\n")
+        
+        parts.append("# Using SlurmRunner for cluster execution\n")
+        parts.append("from scheduler import SlurmRunner\n\n")
+        parts.append("runner = SlurmRunner(\n")
+        parts.append("    partition='compute',\n")
+        parts.append("    time='1:00:00',\n")
+        parts.append("    memory='4G'\n")
+        parts.append(")\n")
+        parts.append("scheduler = AxScheduler(ax_client, runner)\n")
+    parts.append("```\n\n")
+    
+    _write_doc(filename, parts)
     
     logger.info(f"Combined documentation written to {filename}")
 
@@ -2,6 +2,8 @@
 Example usage of the Scheduler for ePIC EIC detector optimization.
 """
 
+import argparse
+import os
 import numpy as np
 from ax.service.ax_client import AxClient
 from scheduler import AxScheduler, JobLibRunner
@@ -11,6 +13,9 @@ def evaluate_detector_design(field_strength, detector_length, detector_radius):
     """
     Example objective function for ePIC EIC detector optimization.
     
+    All arguments may be scalars or equally shaped NumPy arrays, in which
+    case a whole batch of designs is evaluated at once.
+    
     Args:
         field_strength: Magnetic field strength in Tesla
         detector_length: Detector length in meters
@@ -27,7 +32,7 @@ def evaluate_detector_design(field_strength, detector_length, detector_radius):
     resolution = 0.1 / field_strength * (1 + np.exp(-detector_length)) * (1 + np.exp(-detector_radius))
     
     # Better acceptance (higher is better) with larger detector
-    acceptance = (1 - np.exp(-detector_length * detector_radius)) * 100
+    acceptance = -np.expm1(-detector_length * detector_radius) * 100
     
     # Higher cost with larger detector and stronger field
     cost = field_strength * 2 + detector_length * 10 + detector_radius * 15
@@ -48,7 +53,24 @@ def optimization_function(parameterization):
     )
     return metrics
 
-def main():
+PARAMETER_NAMES = ("field_strength", "detector_length", "detector_radius")
+
+# Vectorized wrapper scoring a whole batch of Ax trials in one call
+def optimization_function_batch(parameterizations):
+    """Evaluate a list of parameterizations with one vectorized call."""
+    columns = {
+        name: np.fromiter((p[name] for p in parameterizations), dtype=float, count=len(parameterizations))
+        for name in PARAMETER_NAMES
+    }
+    metrics = evaluate_detector_design(**columns)
+    return [dict(zip(metrics, map(float, values))) for values in zip(*metrics.values())]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--warmstart", help="JSON file with results of previous runs to seed the optimization with")
+    parser.add_argument("--dump-results", default="dump_results.json", help="JSON file to write the completed trials to (default: dump_results.json)")
+    args = parser.parse_args(argv)
+
     # Initialize Ax client
     ax_client = AxClient()
     
@@ -85,11 +107,16 @@ def main():
     # Create a runner - use JobLib for local execution
     runner = JobLibRunner(n_jobs=-1)  # Use all available cores
     
-    # Create the scheduler
-    scheduler = AxScheduler(ax_client, runner)
+    # Create the scheduler, keeping several trials in flight at once
+    scheduler = AxScheduler(ax_client, runner, config={"max_parallel_trials": 4, "monitoring_interval": 1})
     
-    # Set the objective function
+    # Set the objective function, scoring each batch of trials in one vectorized call
     scheduler.set_objective_function(optimization_function)
+    scheduler.set_batch_objective_function(optimization_function_batch)
+    
+    # Seed the model with previously evaluated designs instead of re-exploring them
+    if args.warmstart and os.path.exists(args.warmstart):
+        scheduler.warm_start(args.warmstart)
     
     # Run the optimization
     print("Starting optimization...")
@@ -98,6 +125,9 @@ def main():
     print("\nOptimization complete!")
     print("Best parameters:", best_params)
     
+    # Keep the evaluated designs so the next run can warm start from them
+    scheduler.save_results(args.dump_results)
+    
     # Evaluate the best configuration
     best_metrics = evaluate_detector_design(
         field_strength=best_params["field_strength"],
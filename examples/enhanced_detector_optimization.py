@@ -28,7 +28,7 @@ def evaluate_detector_design(field_strength, detector_length, detector_radius):
     resolution = 0.1 / field_strength * (1 + np.exp(-detector_length)) * (1 + np.exp(-detector_radius))
     
     # Better acceptance (higher is better) with larger detector
-    acceptance = (1 - np.exp(-detector_length * detector_radius)) * 100
+    acceptance = -np.expm1(-detector_length * detector_radius) * 100
     
     # Higher cost with larger detector and stronger field
     cost = field_strength * 2 + detector_length * 10 + detector_radius * 15
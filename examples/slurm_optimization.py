@@ -2,7 +2,10 @@
 Example of using the Scheduler with Slurm for ePIC EIC detector optimization.
 """
 
+import argparse
+import os
 import numpy as np
+from joblib import Parallel, delayed
 from ax.service.ax_client import AxClient
 from scheduler import AxScheduler, SlurmRunner
 
@@ -26,12 +29,13 @@ def evaluate_detector_design(field_strength, detector_length, detector_radius):
     resolution = 0.1 / field_strength * (1 + np.exp(-detector_length)) * (1 + np.exp(-detector_radius))
     
     # Better acceptance (higher is better) with larger detector
-    acceptance = (1 - np.exp(-detector_length * detector_radius)) * 100
+    acceptance = -np.expm1(-detector_length * detector_radius) * 100
     
     # Higher cost with larger detector and stronger field
     cost = field_strength * 2 + detector_length * 10 + detector_radius * 15
     
-    # Simulate a long-running computation
+    # Simulate a long-running computation (optimization_function_batch runs
+    # CPUS_PER_TASK of these at a time inside one Slurm job)
     import time
     time.sleep(10)  # This would be replaced with actual simulation code
     
@@ -51,13 +55,19 @@ def optimization_function(parameterization):
     )
     return metrics
 
-def main():
-    # Initialize Ax client
-    ax_client = AxClient()
-    
+CPUS_PER_TASK = 4  # CPUs allocated to each Slurm job
+TRIALS_PER_JOB = 8  # Trials evaluated by each Slurm job
+
+# Batch wrapper: one Slurm job evaluates several trials on all of its CPUs
+def optimization_function_batch(parameterizations):
+    """Evaluate a batch of parameterizations in parallel inside one Slurm allocation."""
+    return Parallel(n_jobs=CPUS_PER_TASK)(delayed(optimization_function)(p) for p in parameterizations)
+
+def create_experiment(ax_client, name):
+    """Create the detector optimization experiment on the Ax client."""
     # Define the parameter space
     ax_client.create_experiment(
-        name="epic_detector_optimization",
+        name=name,
         parameters=[
             {
                 "name": "field_strength",
@@ -84,13 +94,38 @@ def main():
             "cost": "minimize",
         },
     )
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--warmstart", help="JSON file with results of previous runs to seed the optimization with")
+    parser.add_argument("--dump-results", default="dump_results.json", help="JSON file to write the completed trials to (default: dump_results.json)")
+    parser.add_argument("--storage", help="Database URL to keep the study in so a later run can resume it, e.g. sqlite:///epic_study.db (requires SQLAlchemy; one scheduler at a time)")
+    parser.add_argument("--study-name", default="epic_detector_optimization", help="Name of the study in the database (default: epic_detector_optimization)")
+    args = parser.parse_args(argv)
+
+    # Initialize Ax client. With --storage the experiment is kept in a database, so a restarted
+    # run resumes and extends the same study. Ax's SQL store does not coordinate concurrent
+    # writers, so run only one scheduler against a study at a time.
+    if args.storage:
+        from ax.exceptions.core import ExperimentNotFoundError
+        from ax.storage.sqa_store.structs import DBSettings
+
+        ax_client = AxClient(db_settings=DBSettings(url=args.storage))
+        try:
+            ax_client.load_experiment_from_database(args.study_name)
+        except ExperimentNotFoundError:
+            # No study with this name yet; other database errors are raised
+            create_experiment(ax_client, args.study_name)
+    else:
+        ax_client = AxClient()
+        create_experiment(ax_client, args.study_name)
     
     # Create a Slurm runner
     runner = SlurmRunner(
         partition="physics",          # Slurm partition name
         time_limit="01:00:00",        # 1 hour time limit
         memory="8G",                  # 8GB memory per job
-        cpus_per_task=4,              # 4 CPUs per job
+        cpus_per_task=CPUS_PER_TASK,  # 4 CPUs per job
         config={
             'sbatch_options': {
                 'account': 'eic-project',  # Account to charge
@@ -100,11 +135,16 @@ def main():
         }
     )
     
-    # Create the scheduler
-    scheduler = AxScheduler(ax_client, runner)
+    # Create the scheduler, handing TRIALS_PER_JOB trials to each Slurm job
+    scheduler = AxScheduler(ax_client, runner, config={"max_parallel_trials": TRIALS_PER_JOB})
     
-    # Set the objective function
+    # Set the objective function, evaluating each batch of trials in a single Slurm job
     scheduler.set_objective_function(optimization_function)
+    scheduler.set_batch_objective_function(optimization_function_batch)
+    
+    # Seed the model with previously evaluated designs instead of re-exploring them
+    if args.warmstart and os.path.exists(args.warmstart):
+        scheduler.warm_start(args.warmstart)
     
     # Run the optimization
     print("Starting optimization with Slurm...")
@@ -112,6 +152,9 @@ def main():
     
     print("\nOptimization complete!")
     print("Best parameters:", best_params)
+    
+    # Keep the evaluated designs so the next run can warm start from them
+    scheduler.save_results(args.dump_results)
 
 if __name__ == "__main__":
     main()
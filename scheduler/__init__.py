@@ -4,7 +4,8 @@ Scheduler - A library for AID2E that extends Ax for trial scheduling and monitor
 
 __version__ = "0.1.0"
 
-from .ax_scheduler import AxScheduler
+import importlib
+
 from .trial.trial import Trial
 from .trial.trial_state import TrialState
 from .job.job import Job
@@ -25,3 +26,23 @@ __all__ = [
     "SlurmRunner",
     "PanDAiDDSRunner",
 ]
+
+# Attributes imported on first access. AxScheduler pulls in Ax and through it torch,
+# which takes seconds; jobs and runners (e.g. on Slurm workers) should not pay for that.
+_LAZY_ATTRIBUTES = {"AxScheduler": ".ax_scheduler"}
+
+
+def __getattr__(name):
+    """Import AxScheduler on first access.
+
+    Args:
+        name: The attribute name.
+
+    Returns:
+        The lazily imported attribute.
+    """
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
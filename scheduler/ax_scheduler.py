@@ -2,11 +2,17 @@
 AxScheduler - Integration with Ax for running trials with our runners.
 """
 
+import itertools
+import json
 import logging
+import math
 import os
+import shutil
+import threading
 import time
 import uuid
-from typing import Dict, Any, Optional, Callable, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Callable, Union
 from contextlib import contextmanager
 
 # Try importing Ax
@@ -19,14 +25,24 @@ try:
     # from ax.core.metric import Metric
     # from ax.core.objective import Objective
     # from ax.core.optimization_config import OptimizationConfig
-    from ax.core.arm import Arm
+    from ax.core.data import Data
     from ax.storage.json_store.encoder import object_to_json
     from ax.storage.json_store.decoder import object_from_json
+    from ax.exceptions.core import DataRequiredError
+    from ax.exceptions.generation_strategy import MaxParallelismReachedException
 
     AX_AVAILABLE = True
 except ImportError:
     AX_AVAILABLE = False
 
+# Use orjson for experiment (de)serialization if it is installed
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .trial.trial import Trial
 from .trial.trial_state import TrialState
 from .job.job import Job, JobType
@@ -39,6 +55,29 @@ from .runners.base_runner import BaseRunner
 # setup_logging(log_level='info')
 
 
+def _has_non_finite_metadata(json_data: Dict[str, Any]) -> bool:
+    """
+    Check whether the free-form fields of an encoded experiment hold a NaN or infinite float.
+
+    Metric data is encoded as DataFrame JSON strings, so bare floats only appear in the
+    properties and run/stop metadata; only those are checked, not the whole experiment.
+
+    Args:
+        json_data: The experiment as encoded by object_to_json
+
+    Returns:
+        True if any of these fields holds a non-finite float
+    """
+    fields = [json_data.get("properties")]
+    for trial in json_data.get("trials", {}).values():
+        fields.extend((trial.get("run_metadata"), trial.get("stop_metadata"), trial.get("properties")))
+    try:
+        json.dumps(fields, allow_nan=False)
+    except ValueError:
+        return True
+    return False
+
+
 class AxScheduler:
     """
     A scheduler that integrates with Ax for optimization.
@@ -64,6 +103,9 @@ class AxScheduler:
                 job_output_dir: Directory to store job outputs (default: ~/ax_scheduler_output)
                 cleanup_after_completion: Whether to clean up job files after completion (default: False)
                 synchronous: Whether to run trials synchronously (default: False)
+                max_parallel_trials: Maximum number of trials kept in flight by run_optimization (default: 1)
+                cache_results: Reuse the results of an identical, already evaluated arm instead of
+                    running it again; only valid for deterministic objectives (default: False)
         """
         if not AX_AVAILABLE:
             raise ImportError("Ax is not installed. Install with: pip install ax-platform")
@@ -80,11 +122,23 @@ class AxScheduler:
 
         self.runner = runner
         self.trials = {}  # trial_index -> Trial
+        self._trials_lock = threading.Lock()  # run_trial may be called from several threads
+        # Job ids name directories shared between schedulers (e.g. the Slurm job_dir), possibly on other
+        # hosts, so prefix the cheap counter with a random token drawn once per scheduler
+        self._id_prefix = uuid.uuid4().hex[:8]
+        self._job_counter = itertools.count()
+        self._active_trials = set()  # indices of trials not yet completed or failed
         self.monitoring_interval = self.config.get("monitoring_interval", 10)  # seconds
         self.max_trial_monitoring_time = self.config.get("max_trial_monitoring_time", 86400)  # 24 hours
         self.job_output_dir = self.config.get("job_output_dir", os.path.expanduser("~/ax_scheduler_output"))
         self.cleanup_after_completion = self.config.get("cleanup_after_completion", False)
+        self._cleanup_pool = None  # created on first cleanup
+        self._created_dirs = set()  # working directories known to exist
         self.synchronous = self.config.get("synchronous", False)
+        self.max_parallel_trials = max(1, int(self.config.get("max_parallel_trials", 1)))
+        self.cache_results = self.config.get("cache_results", False)
+        self.results_cache = {}  # arm signature -> raw data
+        self._trial_results = {}  # trial index -> raw data the trial was completed with
 
         # Set up logging
         self.logger = logging.getLogger("AxScheduler")
@@ -100,6 +154,7 @@ class AxScheduler:
 
         # Function lookup map for different job types
         self.objective_fn = None
+        self.batch_objective_fn = None
         self.script_path = None
         self.container_image = None
         self.container_command = None
@@ -118,6 +173,20 @@ class AxScheduler:
         else:
             self.job_type = JobType.FUNCTION
 
+    def set_batch_objective_function(self, batch_objective_fn: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]):
+        """
+        Set a vectorized objective function that scores a whole batch of trials in one call.
+
+        When set, run_optimization asks Ax for up to max_parallel_trials trials at a time and
+        evaluates them with a single runner job instead of dispatching one job per trial, so e.g.
+        one Slurm allocation scores the whole batch.
+
+        Args:
+            batch_objective_fn: Function called as batch_objective_fn(parameterizations=[...]) that
+                returns one metric dict per parameterization
+        """
+        self.batch_objective_fn = batch_objective_fn
+
     def set_script_objective(self, script_path: str):
         """
         Set a script to use as the objective function.
@@ -143,6 +212,32 @@ class AxScheduler:
         self.container_command = container_command
         self.job_type = JobType.CONTAINER
 
+    def _make_working_dir(self, name: str) -> str:
+        """
+        Create a working directory under the job output directory.
+
+        The output directory is created in __init__, so a single mkdir is enough
+        instead of the stat and mkdir calls of os.makedirs, which matters on
+        shared file systems. Directories created before are not touched again.
+
+        Args:
+            name: Name of the directory
+
+        Returns:
+            Path of the working directory
+        """
+        working_dir = os.path.join(self.job_output_dir, name)
+        if working_dir not in self._created_dirs:
+            try:
+                os.mkdir(working_dir)
+            except FileExistsError:
+                pass
+            except FileNotFoundError:
+                # The output directory was removed in the meantime
+                os.makedirs(working_dir, exist_ok=True)
+            self._created_dirs.add(working_dir)
+        return working_dir
+
     def _create_trial_from_ax(self, ax_trial: BaseTrial) -> Trial:
         """
         Create a Trial object from an Ax trial.
@@ -162,11 +257,10 @@ class AxScheduler:
         trial = Trial(trial_id, parameters)
 
         # Create a job for the trial based on the job type
-        job_id = f"{trial_id}_job_{uuid.uuid4().hex[:8]}"
+        job_id = f"{trial_id}_job_{self._id_prefix}{next(self._job_counter):x}"
 
         # Set up working directory for this job
-        working_dir = os.path.join(self.job_output_dir, trial_id)
-        os.makedirs(working_dir, exist_ok=True)
+        working_dir = self._make_working_dir(trial_id)
 
         # Create job based on job type
         if self.job_type == JobType.FUNCTION:
@@ -246,9 +340,23 @@ class AxScheduler:
         # Get the Ax trial
         ax_trial = self.experiment.trials[trial_index]
 
+        cached_results = self.results_cache.get(ax_trial.arm.signature) if self.cache_results else None
+        if cached_results is not None:
+            # An identical arm was already evaluated, reuse its results without running any job
+            self.logger.info(f"Reusing cached results for trial {trial_index} with parameters: {ax_trial.arm.parameters}")
+            trial = Trial(f"trial_{ax_trial.index}", ax_trial.arm.parameters)
+            trial.results = dict(cached_results)
+            trial.state = TrialState.COMPLETED
+            with self._trials_lock:
+                self.trials[trial_index] = trial
+                self._active_trials.add(trial_index)
+            return trial
+
         # Create a Trial object
         trial = self._create_trial_from_ax(ax_trial)
-        self.trials[trial_index] = trial
+        with self._trials_lock:
+            self.trials[trial_index] = trial
+            self._active_trials.add(trial_index)
         self.logger.debug(f"Created trial {trial_index} from ax trail: {trial}")
 
         # Run the trial
@@ -271,6 +379,7 @@ class AxScheduler:
         """
         start_time = time.time()
         while True:
+            seen = self.runner.finished_job_count()
             status = trial.check_status()
             self.logger.debug(f"Trail {trial.trial_id} status: {status}")
 
@@ -286,7 +395,7 @@ class AxScheduler:
                 self.logger.warning(f"Trial {trial.trial_id} monitoring timed out after {self.max_trial_monitoring_time} seconds")
                 break
 
-            time.sleep(self.monitoring_interval)
+            self.runner.wait_for_finished_jobs(seen, timeout=self.monitoring_interval)
 
     def get_next_trial(self) -> Optional[int]:
         """
@@ -301,10 +410,39 @@ class AxScheduler:
         try:
             _, trial_index = self.ax_client.get_next_trial()
             return trial_index
+        except (MaxParallelismReachedException, DataRequiredError) as e:
+            self.logger.debug(f"Not generating a new trial until running trials finish: {str(e)}")
+            return None
         except Exception as e:
             self.logger.error(f"Error generating next trial: {str(e)}")
             return None
 
+    def get_next_trials(self, max_trials: int) -> List[int]:
+        """
+        Generate up to max_trials new trials using Ax in one call.
+
+        Ax fits its model and optimizes the acquisition function once for the whole batch,
+        instead of once per trial.
+
+        Args:
+            max_trials: Maximum number of trials to generate
+
+        Returns:
+            The indices of the new trials, fewer than max_trials if Ax cannot generate more right now
+        """
+        if self.ax_client is None:
+            raise ValueError("An AxClient is required to generate new trials")
+
+        try:
+            trials, _ = self.ax_client.get_next_trials(max_trials=max_trials)
+            return list(trials)
+        except (MaxParallelismReachedException, DataRequiredError) as e:
+            self.logger.debug(f"Not generating new trials until running trials finish: {str(e)}")
+            return []
+        except Exception as e:
+            self.logger.error(f"Error generating next trials: {str(e)}")
+            return []
+
     def complete_trial(self, trial_index: int, raw_data: Optional[Dict[str, Any]] = None) -> None:
         """
         Mark a trial as completed in Ax.
@@ -313,9 +451,59 @@ class AxScheduler:
             trial_index: The index of the trial to complete
             raw_data: Raw data to attach to the trial
         """
+        trial, raw_data = self._get_trial_raw_data(trial_index, raw_data)
+
+        # Complete the trial in Ax
+        if self.ax_client is not None:
+            self.ax_client.complete_trial(trial_index=trial_index, raw_data=raw_data)
+        else:
+            # If we don't have an AxClient, update the trial directly in the experiment
+            self._attach_trial_data({trial_index: raw_data})
+
+        # Clean up if configured to do so
+        if self.cleanup_after_completion:
+            self._cleanup_trial(trial)
+
+    def complete_trials(self, trial_indices: List[int]) -> None:
+        """
+        Mark several trials as completed in Ax.
+
+        Without an AxClient, the data of all trials is attached to the experiment in one go.
+
+        Args:
+            trial_indices: The indices of the trials to complete
+        """
+        if self.ax_client is not None:
+            for trial_index in trial_indices:
+                self.complete_trial(trial_index)
+            return
+
+        trials = {}
+        raw_data_by_trial = {}
+        for trial_index in trial_indices:
+            trials[trial_index], raw_data_by_trial[trial_index] = self._get_trial_raw_data(trial_index)
+        self._attach_trial_data(raw_data_by_trial)
+
+        if self.cleanup_after_completion:
+            for trial in trials.values():
+                self._cleanup_trial(trial)
+
+    def _get_trial_raw_data(self, trial_index: int, raw_data: Optional[Dict[str, Any]] = None):
+        """
+        Look up a finished trial and the raw data to complete it with.
+
+        Args:
+            trial_index: The index of the trial to complete
+            raw_data: Raw data to attach to the trial, defaults to the trial results
+
+        Returns:
+            Tuple of (Trial, raw data)
+        """
         self.logger.info(f"Completing trial {trial_index}")
 
-        trial = self.trials.get(trial_index)
+        with self._trials_lock:
+            trial = self.trials.get(trial_index)
+            self._active_trials.discard(trial_index)
         if trial is None:
             raise ValueError(f"Trial {trial_index} not found")
 
@@ -324,42 +512,124 @@ class AxScheduler:
             raw_data = trial.get_results()
         self.logger.debug(f"Trial {trial_index} results(raw data): {raw_data}")
 
-        # Complete the trial in Ax
-        if self.ax_client is not None:
-            self.ax_client.complete_trial(trial_index=trial_index, raw_data=raw_data)
-        else:
-            # If we don't have an AxClient, update the trial directly in the experiment
-            ax_trial = self.experiment.trials[trial_index]
+        self._trial_results[trial_index] = raw_data
+        if self.cache_results:
+            self.results_cache[self.experiment.trials[trial_index].arm.signature] = raw_data
+
+        return trial, raw_data
+
+    def log_trial_failure(self, trial_index: int) -> None:
+        """
+        Mark a failed trial as failed in Ax, releasing its parallelism slot.
+
+        Args:
+            trial_index: The index of the failed trial
+        """
+        self.logger.info(f"Trial {trial_index} failed")
+        with self._trials_lock:
+            self._active_trials.discard(trial_index)
+        self.ax_client.log_trial_failure(trial_index=trial_index)
+
+    def abandon_trial(self, trial_index: int, reason: Optional[str] = None) -> None:
+        """
+        Mark a cancelled trial as abandoned in Ax, so it no longer counts as running.
+
+        Args:
+            trial_index: The index of the cancelled trial
+            reason: Why the trial was abandoned
+        """
+        self.logger.info(f"Trial {trial_index} was cancelled")
+        with self._trials_lock:
+            self._active_trials.discard(trial_index)
+        self.ax_client.abandon_trial(trial_index=trial_index, reason=reason or "jobs cancelled")
+
+    def get_cached_results(self, trial_index: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the results a trial was completed with, without evaluating anything again.
+
+        Custom Ax metrics can use this in fetch_trial_data instead of re-running the
+        objective for each metric.
+
+        Args:
+            trial_index: The index of the trial
+
+        Returns:
+            The raw data of the trial, or None if the trial was not completed yet
+        """
+        return self._trial_results.get(trial_index)
+
+    def _attach_trial_data(self, raw_data_by_trial: Dict[int, Dict[str, Any]]) -> None:
+        """
+        Attach raw data of several trials to the experiment as one Data object and mark them completed.
+
+        Args:
+            raw_data_by_trial: Mapping of trial index to raw data
+        """
+        import pandas as pd
+
+        with_signature = "metric_signature" in getattr(Data, "REQUIRED_COLUMNS", ())
+        records = []
+        for trial_index, raw_data in raw_data_by_trial.items():
+            arm_name = self.experiment.trials[trial_index].arm.name
             for metric_name, value in raw_data.items():
                 if isinstance(value, dict) and "value" in value:
-                    ax_trial.run().add_metric_outcome(
-                        metric_name=metric_name,
-                        mean=value["value"],
-                        sem=value.get("sem", 0.0),
-                    )
+                    mean, sem = value["value"], value.get("sem", 0.0)
+                elif isinstance(value, (tuple, list)):
+                    mean, sem = value
                 else:
-                    ax_trial.run().add_metric_outcome(metric_name=metric_name, mean=value)
+                    mean, sem = value, 0.0
+                record = {"trial_index": trial_index, "arm_name": arm_name, "metric_name": metric_name, "mean": mean, "sem": sem}
+                if with_signature:
+                    record["metric_signature"] = metric_name
+                records.append(record)
 
-        # Clean up if configured to do so
-        if self.cleanup_after_completion:
-            self._cleanup_trial(trial)
+        if records:
+            self.experiment.attach_data(Data(df=pd.DataFrame.from_records(records)))
+
+        for trial_index in raw_data_by_trial:
+            ax_trial = self.experiment.trials[trial_index]
+            if not ax_trial.status.is_running:
+                ax_trial.mark_running(no_runner_required=True)
+            ax_trial.mark_completed()
 
     def _cleanup_trial(self, trial: Trial) -> None:
         """
         Clean up files for a completed trial.
 
+        The directories are removed in background threads, so slow (network)
+        file systems do not block the optimization loop. Use close() to wait
+        for pending removals.
+
         Args:
             trial: The trial to clean up
         """
         self.logger.info(f"Clean trial {trial.trial_id}")
         for job in trial.jobs:
-            if hasattr(job, "working_dir") and os.path.exists(job.working_dir):
-                import shutil
+            if job.working_dir and os.path.exists(job.working_dir):
+                self._created_dirs.discard(job.working_dir)
+                if self._cleanup_pool is None:
+                    self._cleanup_pool = ThreadPoolExecutor(max_workers=4)
+                self._cleanup_pool.submit(self._remove_dir, job.working_dir)
 
-                try:
-                    shutil.rmtree(job.working_dir)
-                except Exception as e:
-                    self.logger.warning(f"Error cleaning up trial directory: {str(e)}")
+    def _remove_dir(self, path: str) -> None:
+        """
+        Remove a trial directory, logging instead of raising on errors.
+
+        Args:
+            path: The directory to remove
+        """
+        try:
+            shutil.rmtree(path)
+        except Exception as e:
+            self.logger.warning(f"Error cleaning up trial directory: {str(e)}")
+
+    def close(self) -> None:
+        """
+        Wait for pending trial cleanups and release the cleanup threads.
+        """
+        if self._cleanup_pool is not None:
+            self._cleanup_pool.shutdown(wait=True)
+            self._cleanup_pool = None
 
     def is_multi_objective(self) -> bool:
         """
@@ -386,36 +656,66 @@ class AxScheduler:
         if self.ax_client is None:
             raise ValueError("An AxClient is required to run optimization")
 
-        for _ in range(max_trials):
-            # Get the next trial
-            trial_index = self.get_next_trial()
-            self.logger.info(f"Got new trial {trial_index}")
-            if trial_index is None:
+        if self.batch_objective_fn is not None:
+            self._run_batched_trials(max_trials)
+            self.close()
+            return self._get_best_parameters()
+
+        # Keep up to max_parallel_trials trials in flight and complete each one
+        # as soon as it reaches a terminal state, instead of waiting for the
+        # slowest trial before generating the next one.
+        running = {}  # trial_index -> Trial
+        num_submitted = 0
+        generation_blocked = False
+        while True:
+            num_free = min(self.max_parallel_trials - len(running), max_trials - num_submitted)
+            if not generation_blocked and num_free > 0:
+                # Get the next trials for all free slots at once
+                trial_indices = self.get_next_trials(num_free)
+                self.logger.info(f"Got new trials {trial_indices}")
+                if len(trial_indices) < num_free:
+                    generation_blocked = True
+
+                for trial_index in trial_indices:
+                    # Run the trial
+                    self.logger.info(f"Running new trial {trial_index}")
+                    running[trial_index] = self.run_trial(trial_index)
+                    num_submitted += 1
+
+            if not running:
                 break
 
-            # Run the trial
-            self.logger.info(f"Running new trial {trial_index}")
-            trial = self.run_trial(trial_index)
-
-            # If not synchronous, we need to monitor the trial
-            if not self.synchronous:
-                self.logger.info(f"Waiting trial {trial_index} to finish")
-                # Monitor the trial until it's done
-                while trial.check_status() not in [
-                    TrialState.COMPLETED,
-                    TrialState.FAILED,
-                    TrialState.CANCELLED,
-                ]:
-                    time.sleep(self.monitoring_interval)
-                self.logger.debug(f"trial {trial_index} status: {trial.check_status()}")
-
-            # Complete the trial
-            self.logger.info(f"checking to complete trial {trial_index}")
-            if trial.state == TrialState.COMPLETED:
-                self.logger.info(f"Completing trial {trial_index}")
-                self.complete_trial(trial_index)
+            seen = self.runner.finished_job_count()
+            finished = self._collect_finished_trials(running)
+            if not finished:
+                # Wakes up early when the runner reports a finished job
+                self.runner.wait_for_finished_jobs(seen, timeout=self.monitoring_interval)
+                continue
+
+            for trial_index in finished:
+                trial = running.pop(trial_index)
+                # Complete the trial
+                self.logger.info(f"checking to complete trial {trial_index}")
+                if trial.state == TrialState.COMPLETED:
+                    self.logger.info(f"Completing trial {trial_index}")
+                    self.complete_trial(trial_index)
+                elif trial.state == TrialState.FAILED:
+                    self.log_trial_failure(trial_index)
+                elif trial.state == TrialState.CANCELLED:
+                    self.abandon_trial(trial_index)
+            # Finished trials free parallelism slots in Ax, so generation may succeed again
+            generation_blocked = False
+
+        self.close()
+        return self._get_best_parameters()
 
-        # Get the best parameters
+    def _get_best_parameters(self) -> Dict[str, Any]:
+        """
+        Get the best parameters found so far.
+
+        Returns:
+            The Pareto optimal parameters for multi-objective experiments, otherwise the best parameters
+        """
         if self.is_multi_objective():
             pareto_params = self.ax_client.get_pareto_optimal_parameters()
             return pareto_params
@@ -423,18 +723,164 @@ class AxScheduler:
             best_parameters, _ = self.ax_client.get_best_parameters()
             return best_parameters
 
+    def _run_batched_trials(self, max_trials: int) -> None:
+        """
+        Generate trials in batches and score each batch with the batch objective function.
+
+        Trials whose arm was already evaluated reuse the cached results when cache_results is set.
+        If a batch fails, its trials are marked failed and the next batch is generated.
+
+        Args:
+            max_trials: Maximum number of trials to run
+        """
+        num_done = 0
+        while num_done < max_trials:
+            try:
+                batch, _ = self.ax_client.get_next_trials(max_trials=min(self.max_parallel_trials, max_trials - num_done))
+            except Exception as e:
+                self.logger.error(f"Error generating next trials: {str(e)}")
+                break
+            if not batch:
+                break
+
+            trial_indices = list(batch)
+            num_done += len(trial_indices)
+            results = {}
+            to_run = []
+            for trial_index in trial_indices:
+                trial = Trial(f"trial_{trial_index}", batch[trial_index])
+                with self._trials_lock:
+                    self.trials[trial_index] = trial
+                    self._active_trials.add(trial_index)
+                cached_results = self.results_cache.get(self.experiment.trials[trial_index].arm.signature) if self.cache_results else None
+                if cached_results is not None:
+                    self.logger.info(f"Reusing cached results for trial {trial_index} with parameters: {batch[trial_index]}")
+                    results[trial_index] = dict(cached_results)
+                else:
+                    to_run.append(trial_index)
+
+            if to_run:
+                self.logger.info(f"Evaluating trials {to_run} as one batch")
+                batch_results = self._run_batch_job(to_run, [batch[trial_index] for trial_index in to_run])
+                if batch_results is None:
+                    for trial_index in to_run:
+                        self.trials[trial_index].state = TrialState.FAILED
+                        self.log_trial_failure(trial_index)
+                else:
+                    results.update(zip(to_run, batch_results))
+
+            for trial_index, raw_data in results.items():
+                trial = self.trials[trial_index]
+                trial.results = raw_data
+                trial.state = TrialState.COMPLETED
+                self.complete_trial(trial_index, raw_data)
+
+    def _run_batch_job(self, trial_indices: List[int], parameterizations: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Run the batch objective function on a batch of parameterizations as one job on the runner.
+
+        Args:
+            trial_indices: The indices of the trials in the batch
+            parameterizations: The parameters of each trial
+
+        Returns:
+            One metric dict per trial, or None if the batch job failed
+        """
+        batch_id = f"batch_{trial_indices[0]}_{trial_indices[-1]}"
+        working_dir = self._make_working_dir(batch_id)
+
+        job = Job(
+            job_id=f"{batch_id}_job_{self._id_prefix}{next(self._job_counter):x}",
+            job_type=JobType.FUNCTION,
+            function=self.batch_objective_fn,
+            params={"parameterizations": parameterizations},
+            working_dir=working_dir,
+        )
+        job.set_runner(self.runner)
+        batch_trial = Trial(batch_id, {})
+        batch_trial.add_job(job)
+        batch_trial.run()
+        self._wait_for_trial_completion(batch_trial)
+        # The trials of the batch have no jobs of their own, so the batch directory is cleaned here
+        if self.cleanup_after_completion:
+            self._cleanup_trial(batch_trial)
+
+        if batch_trial.state != TrialState.COMPLETED:
+            self.logger.error(f"Error evaluating trials {trial_indices}: {job.get_results().get('error')}")
+            return None
+
+        results = job.get_results()
+        # Runners that serialize results (e.g. Slurm) wrap the return value as {"result": ...}
+        if isinstance(results, dict):
+            results = results.get("result")
+        if not isinstance(results, list) or len(results) != len(trial_indices):
+            self.logger.error(f"Batch objective returned {results!r} for trials {trial_indices}, expected one result per trial")
+            return None
+        return results
+
+    def _check_trials_status(self, trials: Dict[int, Trial]) -> Dict[int, TrialState]:
+        """
+        Poll the jobs of many trials with one batched status query per runner.
+
+        Args:
+            trials: Mapping of trial index to Trial
+
+        Returns:
+            Mapping of trial index to the updated trial state
+        """
+        jobs_by_runner = {}
+        for trial in trials.values():
+            if trial.state in (TrialState.COMPLETED, TrialState.FAILED, TrialState.CANCELLED):
+                continue
+            for job in trial.jobs:
+                runner = job.runner or self.runner
+                jobs_by_runner.setdefault(id(runner), (runner, []))[1].append(job)
+
+        for runner, jobs in jobs_by_runner.values():
+            runner.check_status_batch(jobs)
+
+        return {trial_index: trial.update_state() for trial_index, trial in trials.items()}
+
+    def _collect_finished_trials(self, running: Dict[int, Trial]) -> list:
+        """
+        Poll the running trials once and return the ones in a terminal state.
+
+        Args:
+            running: Mapping of trial index to running Trial
+
+        Returns:
+            List of trial indices that have finished
+        """
+        finished = []
+        for trial_index, status in self._check_trials_status(running).items():
+            if status in (TrialState.COMPLETED, TrialState.FAILED, TrialState.CANCELLED):
+                self.logger.debug(f"trial {trial_index} status: {status}")
+                finished.append(trial_index)
+        return finished
+
     def monitor_trials(self) -> None:
         """
         Monitor all running trials.
+
+        Only trials that have not reached a terminal state yet are checked.
         """
         self.logger.debug("Monitoring trials")
-        for trial_index, trial in self.trials.items():
-            trial_state = trial.check_status()
-
+        # run_trial may add trials from other threads, so work on a snapshot
+        with self._trials_lock:
+            active = {trial_index: self.trials[trial_index] for trial_index in self._active_trials}
+        newly_completed = []
+        for trial_index, trial_state in self._check_trials_status(active).items():
+            if trial_state not in (TrialState.COMPLETED, TrialState.FAILED, TrialState.CANCELLED):
+                continue
+            with self._trials_lock:
+                self._active_trials.discard(trial_index)
             if trial_state == TrialState.COMPLETED and trial_index in self.experiment.trials:  # noqa W503
                 ax_trial = self.experiment.trials[trial_index]
                 if not ax_trial.status.is_completed:
-                    self.complete_trial(trial_index)
+                    newly_completed.append(trial_index)
+
+        if newly_completed:
+            self.complete_trials(newly_completed)
         self.logger.debug("Finished to monitor trials")
 
     def save_experiment(self, path: str) -> None:
@@ -447,11 +893,14 @@ class AxScheduler:
         if not path.endswith(".json"):
             path += ".json"
 
-        with open(path, "w") as f:
-            json_data = object_to_json(self.experiment)
-            import json
-
-            json.dump(json_data, f, indent=2)
+        json_data = object_to_json(self.experiment)
+        # orjson writes NaN and Infinity as null, so only the json module round-trips them
+        if ORJSON_AVAILABLE and not _has_non_finite_metadata(json_data):
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(json_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(path, "w") as f:
+                json.dump(json_data, f, indent=2)
 
     def load_experiment(self, path: str) -> None:
         """
@@ -460,16 +909,73 @@ class AxScheduler:
         Args:
             path: Path to load the experiment from
         """
-        with open(path, "r") as f:
-            import json
-
-            json_data = json.load(f)
-            self.experiment = object_from_json(json_data)
+        with open(path, "rb") as f:
+            content = f.read()
+        json_data = None
+        if ORJSON_AVAILABLE:
+            try:
+                json_data = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                pass  # orjson rejects the NaN/Infinity literals the json module writes
+        if json_data is None:
+            json_data = json.loads(content)
+        self.experiment = object_from_json(json_data)
 
         # If we had an AxClient, update its experiment
         if self.ax_client is not None:
             self.ax_client._experiment = self.experiment
 
+    def warm_start(self, path: str) -> int:
+        """
+        Attach and complete previously evaluated trials so Ax starts from prior knowledge.
+
+        Args:
+            path: JSON file with a list of {"params": ..., "metrics": ...} records, as written by save_results
+
+        Returns:
+            The number of trials attached
+        """
+        if self.ax_client is None:
+            raise ValueError("An AxClient is required to warm start an experiment")
+
+        with open(path, "r") as f:
+            records = json.load(f)
+
+        num_attached = 0
+        for record in records:
+            try:
+                _, trial_index = self.ax_client.attach_trial(parameters=record["params"])
+            except Exception as e:
+                # The search space may have changed since the record was written
+                self.logger.warning(f"Skipping warm start record {record['params']}: {str(e)}")
+                continue
+            raw_data = {name: tuple(value) if isinstance(value, list) else value for name, value in record["metrics"].items()}
+            self.ax_client.complete_trial(trial_index=trial_index, raw_data=raw_data)
+            num_attached += 1
+
+        self.logger.info(f"Warm started experiment with {num_attached} trials from {path}")
+        return num_attached
+
+    def save_results(self, path: str) -> None:
+        """
+        Save the parameters and metrics of all completed trials, for use with warm_start.
+
+        Args:
+            path: Path of the JSON file to write
+        """
+        metrics = {}
+        data = self.experiment.lookup_data().df
+        for trial_index, metric_name, mean, sem in zip(data["trial_index"], data["metric_name"], data["mean"], data["sem"]):
+            metrics.setdefault(int(trial_index), {})[metric_name] = [float(mean), None if math.isnan(sem) else float(sem)]
+
+        records = [
+            {"params": ax_trial.arm.parameters, "metrics": metrics[trial_index]}
+            for trial_index, ax_trial in self.experiment.trials.items()
+            if ax_trial.status.is_completed and trial_index in metrics
+        ]
+        with open(path, "w") as f:
+            json.dump(records, f, indent=2)
+
     @contextmanager
     def batch_trial_context(self):
         """
@@ -512,43 +1018,39 @@ class _TrialBatch:
         self.parameters_list.append(parameters)
 
     def run(self) -> None:
-        """Run all trials in the batch."""
+        """Run all trials added to the batch since it was last run."""
         if self.scheduler.ax_client is None:
             raise ValueError("An AxClient is required to run a batch of trials")
 
-        # Create trials in Ax
+        # Take the pending parameters so running the batch again does not re-attach them
+        parameters_list, self.parameters_list = self.parameters_list, []
+
+        # Create trials in Ax; this only touches the in-memory experiment, which is not thread-safe
         trial_indices = []
-        for parameters in self.parameters_list:
-            arm = Arm(parameters=parameters)
-            trial_index = self.scheduler.ax_client.attach_trial(arm)[0]
+        for parameters in parameters_list:
+            _, trial_index = self.scheduler.ax_client.attach_trial(parameters=parameters)
             trial_indices.append(trial_index)
 
-        # Run trials
-        for trial_index in trial_indices:
-            self.scheduler.run_trial(trial_index)
-
-        # If synchronous, trials are already completed
-        # Otherwise, we need to monitor them
-        if not self.scheduler.synchronous:
-            # Monitor trials until they're all done
-            all_done = False
-            while not all_done:
-                all_done = True
-                for trial_index in trial_indices:
-                    trial = self.scheduler.trials.get(trial_index)
-                    if trial and trial.check_status() not in [
-                        TrialState.COMPLETED,
-                        TrialState.FAILED,
-                        TrialState.CANCELLED,
-                    ]:
-                        all_done = False
-                        break
-
-                if not all_done:
-                    time.sleep(self.scheduler.monitoring_interval)
-
-        # Complete trials
-        for trial_index in trial_indices:
-            trial = self.scheduler.trials.get(trial_index)
-            if trial and trial.state == TrialState.COMPLETED:
-                self.scheduler.complete_trial(trial_index)
+        # Run trials; submitting to Slurm or PanDA is network bound, so submit them concurrently
+        if len(trial_indices) > 1:
+            with ThreadPoolExecutor(max_workers=min(32, len(trial_indices))) as pool:
+                running = dict(zip(trial_indices, pool.map(self.scheduler.run_trial, trial_indices)))
+        else:
+            running = {trial_index: self.scheduler.run_trial(trial_index) for trial_index in trial_indices}
+
+        # Complete each trial as soon as it finishes; synchronous trials are already done
+        while running:
+            seen = self.scheduler.runner.finished_job_count()
+            finished = self.scheduler._collect_finished_trials(running)
+            if not finished:
+                self.scheduler.runner.wait_for_finished_jobs(seen, timeout=self.scheduler.monitoring_interval)
+                continue
+
+            for trial_index in finished:
+                trial = running.pop(trial_index)
+                if trial.state == TrialState.COMPLETED:
+                    self.scheduler.complete_trial(trial_index)
+                elif trial.state == TrialState.FAILED:
+                    self.scheduler.log_trial_failure(trial_index)
+                elif trial.state == TrialState.CANCELLED:
+                    self.scheduler.abandon_trial(trial_index)
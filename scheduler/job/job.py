@@ -2,13 +2,15 @@
 Job - Defines a job that can be run by a runner.
 """
 
-import copy
 import logging
 from typing import Dict, Any, Optional, Callable, List
 from enum import Enum
 import os
+import time
 from datetime import datetime
-from .job_state import JobState
+from .job_state import JobState, UNPOLLED_STATES
+
+_LOGGER = logging.getLogger("Job")
 
 
 class JobType(Enum):
@@ -30,6 +32,39 @@ class Job:
     - Container: A container to run
     """
 
+    # Trials can fan out into thousands of jobs; slots avoid a per-instance __dict__
+    __slots__ = (
+        "job_id",
+        "job_type",
+        "function",
+        "script_path",
+        "container_image",
+        "container_command",
+        "params",
+        "env_vars",
+        "working_dir",
+        "output_files",
+        "state",
+        "_creation_ts",
+        "_start_ts",
+        "_end_ts",
+        "results",
+        "runner",
+        "parent_results",
+        "parent_result_parameter_name",
+        "return_func_results",
+        "with_output_dataset",
+        "output_file",
+        "output_dataset",
+        "num_events",
+        "num_events_per_job",
+        "with_input_datasets",
+        "input_datasets",
+        "internal_id",
+        "parent_internal_id",
+        "logger",
+    )
+
     def __init__(
         self,
         job_id: str,
@@ -50,7 +85,7 @@ class Job:
         num_events: int = 1,
         num_events_per_job: int = 1,
         with_input_datasets: bool = False,
-        input_datasets: dict = {},
+        input_datasets: Optional[dict] = None,
     ):
         """
         Initialize a new job.
@@ -79,9 +114,10 @@ class Job:
         self.output_files = output_files or []
 
         self.state = JobState.CREATED
-        self.creation_time = datetime.now()
-        self.start_time: Optional[datetime] = None
-        self.end_time: Optional[datetime] = None
+        # Raw timestamps; the datetime properties below only build objects when read
+        self._creation_ts = time.time()
+        self._start_ts: Optional[float] = None
+        self._end_ts: Optional[float] = None
         self.results: Dict[str, Any] = {}
         self.runner = None
 
@@ -99,22 +135,22 @@ class Job:
         self.num_events = num_events
         self.num_events_per_job = num_events_per_job
         self.with_input_datasets = with_input_datasets
-        self.input_datasets = input_datasets
+        self.input_datasets = {} if input_datasets is None else input_datasets
 
         self.internal_id = None
         self.parent_internal_id = None
 
-        self.logger = logging.getLogger("Job")
+        self.logger = _LOGGER
 
     def _validate(self):
         """Validate that the job is properly configured."""
-        if self.job_type == JobType.FUNCTION and self.function is None:
+        if self.job_type is JobType.FUNCTION and self.function is None:
             raise ValueError("Function must be provided for FUNCTION job type")
 
-        if self.job_type == JobType.SCRIPT and (self.script_path is None or not os.path.exists(self.script_path)):
+        if self.job_type is JobType.SCRIPT and (self.script_path is None or not os.path.exists(self.script_path)):
             raise ValueError(f"Script path '{self.script_path}' must be provided and exist for SCRIPT job type")
 
-        if self.job_type == JobType.CONTAINER and self.container_image is None:
+        if self.job_type is JobType.CONTAINER and self.container_image is None:
             raise ValueError("Container image must be provided for CONTAINER job type")
 
     def set_internal_id(self, internal_id) -> None:
@@ -135,12 +171,14 @@ class Job:
             job_key: The job key of the curret job
             results: Results from the parent job
         """
-        self.logger.info(f"Set parent results for job {self.job_id} step {step} job_key {job_key}: {results}")
+        self.logger.info("Set parent results for job %s step %s job_key %s: %s", self.job_id, step, job_key, results)
         self.parent_results = results
         if self.parent_result_parameter_name and results:
-            old_params = copy.deepcopy(self.params)
+            # Only format the old parameters if they are logged, instead of deep-copying them
+            old_params = repr(self.params) if self.logger.isEnabledFor(logging.INFO) else None
             self.params[self.parent_result_parameter_name] = results.get(self.parent_result_parameter_name, None)
-            self.logger.info(f"Change parameters for job {self.job_id} step {step} job_key {job_key} from {old_params} to {self.params}")
+            if old_params is not None:
+                self.logger.info("Change parameters for job %s step %s job_key %s from %s to %s", self.job_id, step, job_key, old_params, self.params)
 
     def set_runner(self, runner) -> None:
         """
@@ -158,19 +196,19 @@ class Job:
         Raises:
             ValueError: If no runner has been assigned
         """
-        self.logger.info(f"Run job {self.job_id} with runner: {self.runner}")
+        self.logger.info("Run job %s with runner: %s", self.job_id, self.runner)
         if not self.runner:
             raise ValueError("No runner assigned to this job")
 
         self.state = JobState.RUNNING
-        self.start_time = datetime.now()
+        self._start_ts = time.time()
         self.runner.run_job(self)
 
     def check_status(self) -> None:
         """
         Run to check the status of the job.
         """
-        if self.state not in [JobState.NEW, JobState.READY, JobState.CREATED, JobState.COMPLETED, JobState.FAILED]:
+        if self.state not in UNPOLLED_STATES:
             if self.return_func_results:
                 self.runner.check_job_status(self)
 
@@ -208,9 +246,9 @@ class Job:
         Args:
             results: The results of the job
         """
-        self.logger.info(f"Complete job {self.job_id}")
+        self.logger.info("Complete job %s", self.job_id)
         self.state = JobState.COMPLETED
-        self.end_time = datetime.now()
+        self._end_ts = time.time()
         self.results = results
 
     def fail(self, error: Optional[str] = None) -> None:
@@ -220,12 +258,27 @@ class Job:
         Args:
             error: The error that caused the job to fail
         """
-        self.logger.info(f"Fail job {self.job_id}")
+        self.logger.info("Fail job %s", self.job_id)
         self.state = JobState.FAILED
-        self.end_time = datetime.now()
+        self._end_ts = time.time()
         if error:
             self.results["error"] = error
 
+    @property
+    def creation_time(self) -> datetime:
+        """Time the job was created."""
+        return datetime.fromtimestamp(self._creation_ts)
+
+    @property
+    def start_time(self) -> Optional[datetime]:
+        """Time the job was started, or None if it has not run."""
+        return datetime.fromtimestamp(self._start_ts) if self._start_ts is not None else None
+
+    @property
+    def end_time(self) -> Optional[datetime]:
+        """Time the job completed or failed, or None if it has not finished."""
+        return datetime.fromtimestamp(self._end_ts) if self._end_ts is not None else None
+
     def get_results(self) -> Dict[str, Any]:
         """
         Get the results of this job.
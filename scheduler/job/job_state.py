@@ -22,4 +22,13 @@ class JobState(Enum):
     RUNNINGNOMONITOR = auto()
 
     def __str__(self):
-        return self.name
+        # _name_ skips the enum .name property lookup
+        return self._name_
+
+
+# States checked on every scheduler tick, as frozensets for constant-time membership tests
+TERMINAL_STATES = frozenset({JobState.COMPLETED, JobState.FAILED})
+# States in which there is nothing to poll: not submitted yet, or finished
+UNPOLLED_STATES = frozenset({JobState.NEW, JobState.READY, JobState.CREATED}) | TERMINAL_STATES
+# States of a parent step that release the steps depending on it
+PARENT_DONE_STATES = TERMINAL_STATES | {JobState.RUNNINGNOMONITOR}
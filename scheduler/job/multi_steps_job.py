@@ -4,13 +4,23 @@ Job - Defines a job that can be run by a runner.
 
 import copy
 import logging
+import re
+import sys
+import time
 import uuid
 from collections import defaultdict
-from datetime import datetime
 from itertools import product
 from typing import Dict, Any, Optional, List, Union
 from .job import Job, JobType
-from .job_state import JobState
+from .job_state import JobState, PARENT_DONE_STATES, TERMINAL_STATES, UNPOLLED_STATES
+
+_LOGGER = logging.getLogger("MultiStepsJob")
+
+# parameter values that step jobs could change in place and so must not share
+_MUTABLE_TYPES = (dict, list, set)
+
+# placeholders in output_dataset and input_datasets templates
+_DATASET_TEMPLATE_RE = re.compile(r"#(global_parameter_key|trial_id|job_id)")
 
 
 class MultiStepsFunction(object):
@@ -24,7 +34,7 @@ class MultiStepsFunction(object):
         deps=None,
         final=None,
         global_parameters=None,
-        global_parameters_steps=[],
+        global_parameters_steps=None,
     ):
         """
         Initialize MultiStepsFunction.
@@ -57,7 +67,7 @@ class MultiStepsFunction(object):
         # parameters in your function.
         # in the final function, you need to wat to merge the results to different objectives
         self.global_parameters = global_parameters
-        self.global_parameters_steps = global_parameters_steps
+        self.global_parameters_steps = global_parameters_steps or []
 
 
 class MultiStepsJob(Job):
@@ -67,6 +77,22 @@ class MultiStepsJob(Job):
     Each step is a job with different runners.
     """
 
+    __slots__ = (
+        "trial_id",
+        "step_jobs",
+        "step_states",
+        "_flat_step_jobs",
+        "_last_step_states",
+        "_child_steps",
+        "_ready_steps",
+        "_step_priority",
+        "deps",
+        "_dep_resolvers",
+        "final",
+        "global_parameters",
+        "global_parameters_steps",
+    )
+
     def __init__(
         self,
         job_id: str,
@@ -85,7 +111,7 @@ class MultiStepsJob(Job):
         num_events: int = 1,
         num_events_per_job: int = 1,
         with_input_datasets: bool = False,
-        input_datasets: dict = {},
+        input_datasets: Optional[dict] = None,
     ):
         """
         Initialize a new job.
@@ -109,9 +135,9 @@ class MultiStepsJob(Job):
         self.output_files = output_files or []
 
         self.state = JobState.CREATED
-        self.creation_time = datetime.now()
-        self.start_time: Optional[datetime] = None
-        self.end_time: Optional[datetime] = None
+        self._creation_ts = time.time()
+        self._start_ts: Optional[float] = None
+        self._end_ts: Optional[float] = None
         self.results: Dict[str, Any] = {}
         self.runner = None
 
@@ -120,7 +146,13 @@ class MultiStepsJob(Job):
 
         self.step_jobs = {}
         self.step_states = {}
+        self._flat_step_jobs = []  # (step_name, g_param_key, job) for all step jobs, in step order
+        self._last_step_states = None  # step job states seen by the last check_status
+        self._child_steps = {}  # parent step name -> names of the steps depending on it
+        self._ready_steps = set()  # NEW steps whose dependency is satisfied
+        self._step_priority = {}  # step name -> sort key, longest downstream chain first
         self.deps = {}
+        self._dep_resolvers = {}  # step name -> method resolving its parent results
 
         # if final is not set, it will use the last step in objective_funcs.
         # The final step will set its result as the job's result
@@ -140,23 +172,23 @@ class MultiStepsJob(Job):
         self.num_events = num_events
         self.num_events_per_job = num_events_per_job
         self.with_input_datasets = with_input_datasets
-        self.input_datasets = input_datasets
+        self.input_datasets = {} if input_datasets is None else input_datasets
 
         self.internal_id = None
         self.parent_internal_id = None
 
-        self.logger = logging.getLogger("MultiStepsJob")
+        self.logger = _LOGGER
 
         self._initialize()
 
     def _validate(self):
         """Validate that the job is properly configured."""
-        if not self.job_type == JobType.MULTISTEPSFUNCTION:
+        if self.job_type is not JobType.MULTISTEPSFUNCTION:
             raise ValueError("Job type must be MULFUNCTION")
-            if self.function is None:
-                raise ValueError("Function must be provided for MULTISTEPSFUNCTION job type")
-            elif not isinstance(self.function, MultiStepsFunction):
-                raise ValueError("MultiStepsFunction must be provided for MULTISTEPSFUNCTION job type")
+        if self.function is None:
+            raise ValueError("Function must be provided for MULTISTEPSFUNCTION job type")
+        elif not isinstance(self.function, MultiStepsFunction):
+            raise ValueError("MultiStepsFunction must be provided for MULTISTEPSFUNCTION job type")
 
     def get_step_job(
         self,
@@ -175,14 +207,16 @@ class MultiStepsJob(Job):
         num_events=1,
         num_events_per_job=1,
         with_input_datasets=False,
-        input_datasets={},
+        input_datasets=None,
     ) -> Job:
         """
         Generate a job from a step configuration.
         """
-        new_params = copy.deepcopy(self.params)
-        if additional_parameters:
-            new_params.update(additional_parameters)
+        # Only mutable containers are deep-copied; numbers and strings from Ax are shared as is
+        new_params = {
+            k: copy.deepcopy(v) if isinstance(v, _MUTABLE_TYPES) else v
+            for k, v in {**self.params, **(additional_parameters or {})}.items()
+        }
 
         # Create a job for the trial based on the job type
         job_id = f"{self.trial_id}_job_{uuid.uuid4().hex[:8]}"
@@ -242,6 +276,19 @@ class MultiStepsJob(Job):
             return "None"
         return tuple(sorted(key.items()))
 
+    def _iter_global_parameters(self):
+        """
+        Generate the combinations of the global parameters one at a time.
+
+        Yields:
+            Tuple of (dict with one value for each global parameter, its step_jobs key). The key
+            is the same as get_key_from_dict would return, built without sorting the items again.
+        """
+        sorted_keys = sorted(self.global_parameters.keys())
+        for values in product(*[self.global_parameters[k] for k in sorted_keys]):
+            g_params_key = tuple(zip(sorted_keys, values))
+            yield dict(g_params_key), g_params_key
+
     def _initialize(self) -> None:
         """
         Initialize MultiStepsJobs from MultiStepsFunction.
@@ -250,14 +297,14 @@ class MultiStepsJob(Job):
         deps = self.function.deps
         if self.function.global_parameters:
             self.logger.info(f"func global parameters: {self.function.global_parameters}")
-            g_parameters = self.function.global_parameters
-
-            sorted_keys = sorted(g_parameters.keys())
-            combinations = [dict(zip(sorted_keys, values)) for values in product(*[g_parameters[k] for k in sorted_keys])]
-            self.global_parameters = combinations
+            # Keep the value lists; the combinations are generated on the fly for each step
+            self.global_parameters = self.function.global_parameters
         self.global_parameters_steps = self.function.global_parameters_steps
 
         for step_name in objective_funcs:
+            # Step names are the keys of every step lookup; interned, the parent names in deps
+            # resolve to the same string objects and compare by identity
+            step_name = sys.intern(step_name)
             func = objective_funcs[step_name].get("func", None)
             script_path = objective_funcs[step_name].get("script_path", None)
             container_image = objective_funcs[step_name].get("container_image", None)
@@ -281,18 +328,14 @@ class MultiStepsJob(Job):
 
             self.step_states[step_name] = {"state": JobState.NEW, "return_func_results": return_func_results}
             if not self.global_parameters or step_name not in self.global_parameters_steps:
-                output_dataset = orig_output_dataset
-                input_datasets = copy.deepcopy(orig_input_datasets)
                 if orig_output_dataset:
-                    output_dataset = orig_output_dataset.replace("#global_parameter_key", "None").replace("#trial_id", self.trial_id).replace("#job_id", self.job_id)
+                    output_dataset = self._fill_dataset_template(orig_output_dataset, "None")
                 else:
                     output_dataset = orig_output_dataset
                 if orig_input_datasets:
-                    input_datasets = copy.deepcopy(orig_input_datasets)
-                    for k in input_datasets.keys():
-                        input_datasets[k] = input_datasets[k].replace("#global_parameter_key", "None").replace("#trial_id", self.trial_id).replace("#job_id", self.job_id)
+                    input_datasets = {k: self._fill_dataset_template(v, "None") for k, v in orig_input_datasets.items()}
                 else:
-                    input_datasets = orig_input_datasets
+                    input_datasets = None
 
                 step_job = self.get_step_job(
                     job_type,
@@ -316,20 +359,18 @@ class MultiStepsJob(Job):
                 self.step_jobs[step_name] = {g_params: step_job}
             else:
                 self.step_jobs[step_name] = {}
-                for g_params in self.global_parameters:
-                    g_param_str = "+".join(f"{k}_{v}" for k, v in sorted(g_params.items()))
+                for g_params, g_params_key in self._iter_global_parameters():
+                    g_param_str = "+".join(f"{k}_{v}" for k, v in g_params_key)
                     g_param_str = g_param_str.replace("+", "plus")
                     g_param_str = g_param_str.replace("-", "minus")
                     if orig_output_dataset:
-                        output_dataset = orig_output_dataset.replace("#global_parameter_key", g_param_str).replace("#trial_id", self.trial_id).replace("#job_id", self.job_id)
+                        output_dataset = self._fill_dataset_template(orig_output_dataset, g_param_str)
                     else:
                         output_dataset = orig_output_dataset
                     if orig_input_datasets:
-                        input_datasets = copy.deepcopy(orig_input_datasets)
-                        for k in input_datasets.keys():
-                            input_datasets[k] = input_datasets[k].replace("#global_parameter_key", g_param_str).replace("#trial_id", self.trial_id).replace("#job_id", self.job_id)
+                        input_datasets = {k: self._fill_dataset_template(v, g_param_str) for k, v in orig_input_datasets.items()}
                     else:
-                        input_datasets = orig_input_datasets
+                        input_datasets = None
 
                     step_job = self.get_step_job(
                         job_type,
@@ -349,47 +390,87 @@ class MultiStepsJob(Job):
                         with_input_datasets=with_input_datasets,
                         input_datasets=input_datasets,
                     )
-                    g_params_key = self.get_key_from_dict(g_params)
                     self.step_jobs[step_name][g_params_key] = step_job
+        self._flat_step_jobs = [
+            (step_name, g_param_key, step_job) for step_name, jobs in self.step_jobs.items() for g_param_key, step_job in jobs.items()
+        ]
+
         self.deps = {}
         if deps:
             for dep in deps:
                 if type(deps[dep]) in [str]:
-                    self.deps[dep] = {
-                        "parent": deps[dep],
+                    self.deps[sys.intern(dep)] = {
+                        "parent": sys.intern(deps[dep]),
                         "state": JobState.NEW,
                         "dep_type": "results",
                         "dep_map": "one2one",
                     }
                 elif type(deps[dep]) in [dict]:
-                    self.deps[dep] = {
-                        "parent": deps[dep]["parent"],
+                    self.deps[sys.intern(dep)] = {
+                        "parent": sys.intern(deps[dep]["parent"]),
                         "state": JobState.NEW,
                         "dep_type": deps[dep].get("dep_type", "results"),
                         "dep_map": deps[dep].get("dep_map", "one2one")
                     }
 
-        if not self.final:
-            for step_name in self.step_jobs:
-                # last step_name
-                self.final = step_name
+        self._dep_resolvers = {step_name: self._get_dep_resolver(step_name, dep) for step_name, dep in self.deps.items()}
+
+        # Steps that depend on each parent step, to release them as soon as the parent is done
+        self._child_steps = defaultdict(list)
+        for step_name, dep in self.deps.items():
+            self._child_steps[dep["parent"]].append(step_name)
+        self._step_priority = self._get_step_priorities()
+        self._ready_steps = {step_name for step_name in self.step_jobs if step_name not in self.deps}
+
+        if self.function.final:
+            if self.function.final not in self.step_jobs:
+                raise ValueError(f"Final step {self.function.final} is not in objective_funcs: {list(self.step_jobs)}")
+            self.final = sys.intern(self.function.final)
+        else:
+            self.final = list(self.step_jobs)[-1]
+
+        self.logger.info("Job %s is initialized: step_jobs: %s, deps: %s, final: %s", self.job_id, self.step_jobs, self.deps, self.final)
+        self.logger.info("Job %s is initialized: global parameters: %s, global parameter steps: %s", self.job_id, self.global_parameters, self.global_parameters_steps)
+
+    def _fill_dataset_template(self, template: str, g_param_str: str) -> str:
+        """
+        Substitute the #global_parameter_key, #trial_id and #job_id placeholders of a dataset name in one pass.
 
-        self.logger.info(f"Job {self.job_id} is initialized: step_jobs: {self.step_jobs}, deps: {self.deps}, final: {self.final}")
-        self.logger.info(f"Job {self.job_id} is initialized: global parameters: {self.global_parameters}, global parameter steps: {self.global_parameters_steps}")
+        Args:
+            template: The dataset name template.
+            g_param_str: The value of #global_parameter_key.
+        """
+        subs = {"global_parameter_key": g_param_str, "trial_id": self.trial_id, "job_id": self.job_id}
+        return _DATASET_TEMPLATE_RE.sub(lambda m: subs[m.group(1)], template)
 
     def get_ready_steps(self) -> list:
         """
         Get steps that are ready to run.
         """
-        if self.state in [JobState.COMPLETED, JobState.FAILED]:
+        if self.state in TERMINAL_STATES:
             return {}
 
-        readys = []
+        # _ready_steps is kept up to date by _set_step_state
+        return sorted(self._ready_steps, key=self._step_priority.__getitem__)
+
+    def _get_step_priorities(self) -> dict:
+        """
+        Rank the steps so that the ready steps heading the longest chains of dependent steps run first.
+
+        Returns:
+            A dict of step name -> (-rank, position in objective_funcs), where rank is the number of
+            steps in the longest chain starting at the step.
+        """
+        ranks = dict.fromkeys(self.step_jobs, 1)
         for step_name in self.step_jobs:
-            if (step_name not in self.deps or self.deps[step_name].get("state", JobState.NEW) == JobState.READY) and (self.step_states[step_name]["state"] in [JobState.NEW]):
-                # self.step_jobs[step_name].state not in [JobState.COMPLETED, JobState.FAILED, JobState.RUNNING, JobState.PAUSED, JobState.CANCELLED]:
-                readys.append(step_name)
-        return readys
+            # every step has at most one parent: walk up the chain, bounded in case of a cycle
+            depth, current = 1, step_name
+            while current in self.deps and depth <= len(self.step_jobs):
+                current = self.deps[current]["parent"]
+                depth += 1
+                if current in ranks and ranks[current] < depth:
+                    ranks[current] = depth
+        return {step_name: (-ranks[step_name], i) for i, step_name in enumerate(self.step_jobs)}
 
     def set_runner(self, runner) -> None:
         """
@@ -418,12 +499,14 @@ class MultiStepsJob(Job):
             job_key: The job key of the curret job
             results: Results from the parent job
         """
-        self.logger.info(f"Set parent results for job {self.job_id} step {step} job_key {job_key}: {results}")
+        self.logger.info("Set parent results for job %s step %s job_key %s: %s", self.job_id, step, job_key, results)
         self.parent_results = results
         if self.parent_result_parameter_name and results:
-            old_params = copy.deepcopy(self.params)
+            # Only format the old parameters if they are logged, instead of deep-copying them
+            old_params = repr(self.params) if self.logger.isEnabledFor(logging.INFO) else None
             self.params[self.parent_result_parameter_name] = results.get(self.parent_result_parameter_name, None)
-            self.logger.info(f"Change parameters for job {self.job_id} step {step} job_key {job_key} from {old_params} to {self.params}")
+            if old_params is not None:
+                self.logger.info("Change parameters for job %s step %s job_key %s from %s to %s", self.job_id, step, job_key, old_params, self.params)
 
     def get_parent_results(self, step_job, step_name, g_param_key) -> (bool, object):
         """
@@ -434,53 +517,91 @@ class MultiStepsJob(Job):
             step_name: The current step name.
             g_param_key: The current step key.
         """
-        self.logger.info(f"Get parent results for step {step_name} job key {g_param_key}")
+        self.logger.info("Get parent results for step %s job key %s", step_name, g_param_key)
         if step_name not in self.deps:
-            self.logger.info(f"No parent dependency for step {step_name} job key {g_param_key}")
+            self.logger.info("No parent dependency for step %s job key %s", step_name, g_param_key)
             return False, None
 
-        parent = self.deps[step_name].get("parent", None)
-        dep_type = self.deps[step_name].get("dep_type", "results")
-        dep_map = self.deps[step_name].get("dep_map", "one2one")
-        parent_jobs = self.step_jobs.get(parent, {})
-        self.logger.info(f"For step {step_name} job key {g_param_key}: parent {parent}, dep_type {dep_type}, dep_map {dep_map}, parent_jobs: {parent_jobs}")
+        parent_jobs = self.step_jobs.get(self.deps[step_name]["parent"], {})
+        return self._dep_resolvers[step_name](step_job, step_name, g_param_key, parent_jobs)
+
+    def _get_dep_resolver(self, step_name, dep):
+        """
+        Select the method resolving the parent results of a step from its dependency.
+
+        Args:
+            step_name: The step name.
+            dep: The normalized dependency of the step.
 
-        if dep_type in ["datasets"]:
+        Returns:
+            The resolver method, called with (step_job, step_name, g_param_key, parent_jobs).
+        """
+        if dep["dep_type"] == "datasets":
             # depend on the rucio dataset name
-            if dep_map != "one2one":
-                dep_map == "one2one"
-                self.logger.info(f"For step {step_name} job key {g_param_key}, dep_type is datasets. the dep_map forced to one2one")
+            if dep["dep_map"] != "one2one":
+                self.logger.info("For step %s, dep_type is datasets. the dep_map forced to one2one", step_name)
+            return self._resolve_datasets_dep
+        if dep["dep_map"] == "one2one":
+            return self._resolve_one2one_dep
+        if dep["dep_map"] == "all2one":
+            return self._resolve_all2one_dep
+        raise ValueError(f"Step {step_name} has unsupported dep_map {dep['dep_map']}")
+
+    def _get_parent_job(self, step_name, g_param_key, parent_jobs):
+        """
+        Get the parent job with the same global parameter key as a step job.
+        """
+        parent_job = parent_jobs.get(g_param_key, None)
+        if not parent_job:
+            err = f"For step {step_name} job key {g_param_key} with dep map one2one, no parent jobs are found for job key {g_param_key}"
+            self.logger.error(err)
+            raise Exception(err)
+        return parent_job
 
-            parent_job = parent_jobs.get(g_param_key, None)
-            if not parent_job:
-                err = f"For step {step_name} job key {g_param_key} with dep map {dep_map}, no parent jobs are found for job key {g_param_key}"
-                self.logger.error(err)
-                raise Exception(err)
+    def _resolve_datasets_dep(self, step_job, step_name, g_param_key, parent_jobs) -> (bool, object):
+        """
+        Link a step job to the dataset of its parent job. No results are passed.
+        """
+        parent_job = self._get_parent_job(step_name, g_param_key, parent_jobs)
+        step_job.parent_internal_id = parent_job.internal_id
+        return False, None
 
-            step_job.parent_internal_id = parent_job.internal_id
+    def _resolve_one2one_dep(self, step_job, step_name, g_param_key, parent_jobs) -> (bool, object):
+        """
+        Get the results of the parent job with the same global parameter key.
+        """
+        if not parent_jobs:
             return False, None
+        return True, self._get_parent_job(step_name, g_param_key, parent_jobs).results
+
+    def _resolve_all2one_dep(self, step_job, step_name, g_param_key, parent_jobs) -> (bool, object):
+        """
+        Merge the results of all parent jobs as {metric: {job_key: value}}.
+        """
         if not parent_jobs:
-            # not parent jobs
             return False, None
-        if dep_map == "one2one":
-            parent_job = parent_jobs.get(g_param_key, None)
-            if not parent_job:
-                err = f"For step {step_name} job key {g_param_key} with dep map {dep_map}, no parent jobs are found for job key {g_param_key}"
-                self.logger.error(err)
-                raise Exception(err)
-
-            results = parent_job.results
-            return True, results
-        elif dep_map == "all2one":
-            results = defaultdict(dict)
-            for job_key, job in parent_jobs.items():
-                for metric, value in job.results.items():
-                    results[metric][job_key] = value
-
-            # Optionally convert back to regular dict
-            results = dict(results)
-            return True, results
-        return None
+        results = defaultdict(dict)
+        for job_key, job in parent_jobs.items():
+            for metric, value in job.results.items():
+                results[metric][job_key] = value
+        return True, dict(results)
+
+    def _set_step_state(self, step_name, state) -> None:
+        """
+        Set the state of a step and keep the ready steps and the dependencies of its children up to date.
+
+        Args:
+            step_name: The step name.
+            state: The new state of the step.
+        """
+        self.step_states[step_name]["state"] = state
+        if state != JobState.NEW:
+            self._ready_steps.discard(step_name)
+        if state in PARENT_DONE_STATES:
+            for child in self._child_steps.get(step_name, ()):
+                self.deps[child]["state"] = JobState.READY
+                if child in self.step_states and self.step_states[child]["state"] == JobState.NEW:
+                    self._ready_steps.add(child)
 
     def run_ready_steps(self) -> None:
         """
@@ -488,26 +609,25 @@ class MultiStepsJob(Job):
         """
         ready_steps = self.get_ready_steps()
         if ready_steps:
-            self.logger.info(f"Ready to run steps: {ready_steps}")
+            self.logger.info("Ready to run steps: %s", ready_steps)
         for step in ready_steps:
-            for g_param_key in self.step_jobs[step]:
-                step_job = self.step_jobs[step][g_param_key]
+            for g_param_key, step_job in self.step_jobs[step].items():
                 has_parent, parent_results = self.get_parent_results(step_job, step, g_param_key)
                 if has_parent:
                     step_job.set_parent_results(step, g_param_key, parent_results)
-                self.logger.info(f"Ready to run job {step_job.job_id} step {step} job_key {g_param_key}")
+                self.logger.info("Ready to run job %s step %s job_key %s", step_job.job_id, step, g_param_key)
                 step_job.run()
             if self.step_states[step]["return_func_results"]:
-                self.step_states[step]["state"] = JobState.RUNNING
+                self._set_step_state(step, JobState.RUNNING)
             else:
-                self.step_states[step]["state"] = JobState.RUNNINGNOMONITOR
+                self._set_step_state(step, JobState.RUNNINGNOMONITOR)
 
     def run(self) -> None:
         """
         Run this job using its assigned runner.
         """
         self.state = JobState.RUNNING
-        self.start_time = datetime.now()
+        self._start_ts = time.time()
         self.run_ready_steps()
 
     def get_final_results(self) -> None:
@@ -515,68 +635,76 @@ class MultiStepsJob(Job):
         Get the final step's results and assign it to the MultiStepJob.
         """
         self.logger.info(f"Getting final results for Job {self.job_id}")
-        if self.step_states[self.final]["state"] not in [JobState.COMPLETED, JobState.FAILED]:
+        if self.step_states[self.final]["state"] not in TERMINAL_STATES:
             return
-        g_param_keys = list(self.step_jobs[self.final].keys())
-        if len(g_param_keys) != 1:
-            error = f"Job {self.job_id} should have only one job to get results. However it has different jobs {g_param_keys}"
+        final_jobs = self.step_jobs[self.final]
+        if len(final_jobs) != 1:
+            error = f"Job {self.job_id} should have only one job to get results. However it has different jobs {list(final_jobs)}"
             self.logger.error(error)
             self.fail({"error": error})
-        g_param_key = g_param_keys[0]
-        self.results = self.step_jobs[self.final][g_param_key].results
-        self.logger.info(f"Job {self.job_id} set results from step {self.final} g_param_key {g_param_key} job {self.step_jobs[self.final][g_param_key].job_id}")
+        g_param_key, final_job = next(iter(final_jobs.items()))
+        self.results = final_job.results
+        self.logger.info(f"Job {self.job_id} set results from step {self.final} g_param_key {g_param_key} job {final_job.job_id}")
 
     def check_status(self) -> None:
         """
         Run to check the status of the job.
         """
-        if self.state in [JobState.NEW, JobState.READY, JobState.CREATED, JobState.COMPLETED, JobState.FAILED]:
+        if self.state in UNPOLLED_STATES:
+            return
+
+        # check the monitored steps, with one batched status query per runner
+        jobs_by_runner = {}
+        for step_name, g_param_key, step_job in self._flat_step_jobs:
+            if step_job.return_func_results:
+                jobs_by_runner.setdefault(id(step_job.runner), (step_job.runner, []))[1].append(step_job)
+        for runner, jobs in jobs_by_runner.values():
+            runner.check_status_batch(jobs)
+
+        # Step and dependency states only change when a step job does. The snapshot is taken
+        # before run_ready_steps, so steps started below count as a change on the next check.
+        step_states = [step_job.state for _, _, step_job in self._flat_step_jobs]
+        if step_states == self._last_step_states:
             return
+        self._last_step_states = step_states
 
-        # check the steps
         has_failures = False
-        for step_name in self.step_jobs:
-            for g_param_key in self.step_jobs[step_name]:
-                if not self.step_jobs[step_name][g_param_key].return_func_results:
-                    continue
-                self.step_jobs[step_name][g_param_key].check_status()
-                if self.step_jobs[step_name][g_param_key].has_failed():
+        step_completed = dict.fromkeys(self.step_jobs, True)
+        step_failed = dict.fromkeys(self.step_jobs, False)
+        for step_name, g_param_key, step_job in self._flat_step_jobs:
+            if not step_job.is_completed():
+                step_completed[step_name] = False
+            if step_job.has_failed():
+                step_failed[step_name] = True
+                if step_job.return_func_results:
                     self.logger.error(f"Job {self.job_id} failed at step {step_name} with global_parameters {g_param_key}")
                     has_failures = True
         if has_failures:
-            for step_name in self.step_jobs:
-                for g_param_key in self.step_jobs[step_name]:
-                    self.step_jobs[step_name][g_param_key].cancel()
-                    self.logger.error(f"Job {self.job_id} has failures, cancel step {step_name} with global_parameters {g_param_key}")
+            for step_name, g_param_key, step_job in self._flat_step_jobs:
+                step_job.cancel()
+                self.logger.error(f"Job {self.job_id} has failures, cancel step {step_name} with global_parameters {g_param_key}")
             self.logger.info(f"Set Job {self.job_id} failed")
             self.fail({"error": f"Job {self.job_id} has failures"})
             return
 
         for step_name in self.step_jobs:
-            if all(self.step_jobs[step_name][g_param_key].is_completed()for g_param_key in self.step_jobs[step_name]):
+            if step_completed[step_name]:
                 self.logger.info(f"Job {self.job_id} step {step_name} completed")
-                self.step_states[step_name]["state"] = JobState.COMPLETED
-            elif any(self.step_jobs[step_name][g_param_key].has_failed()for g_param_key in self.step_jobs[step_name]):
+                self._set_step_state(step_name, JobState.COMPLETED)
+            elif step_failed[step_name]:
                 self.logger.info(f"Job {self.job_id} step {step_name} has failed")
-                self.step_states[step_name]["state"] = JobState.FAILED
+                self._set_step_state(step_name, JobState.FAILED)
 
         # if the final step terminates, terminate the job
-        if self.step_states[self.final]["state"] in [JobState.COMPLETED]:
+        if self.step_states[self.final]["state"] == JobState.COMPLETED:
             self.get_final_results()
             self.complete(self.results)
             return
-        elif self.step_states[self.final]["state"] in [JobState.FAILED]:
+        elif self.step_states[self.final]["state"] == JobState.FAILED:
             self.get_final_results()
             self.fail(self.results)
             return
 
-        # check the dependencies
-        for dep in self.deps:
-            if self.deps[dep]["state"] not in [JobState.READY]:
-                parent = self.deps[dep]["parent"]
-                if self.step_states[parent]["state"] in [JobState.COMPLETED, JobState.FAILED, JobState.RUNNINGNOMONITOR]:
-                    self.deps[dep]["state"] = JobState.READY
-
         # run ready steps
         self.run_ready_steps()
 
@@ -615,7 +743,7 @@ class MultiStepsJob(Job):
             results: The results of the job
         """
         self.state = JobState.COMPLETED
-        self.end_time = datetime.now()
+        self._end_ts = time.time()
         self.results = results
 
     def fail(self, error: Optional[str] = None) -> None:
@@ -626,7 +754,7 @@ class MultiStepsJob(Job):
             error: The error that caused the job to fail
         """
         self.state = JobState.FAILED
-        self.end_time = datetime.now()
+        self._end_ts = time.time()
         if error:
             self.results["error"] = error
 
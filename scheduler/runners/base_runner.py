@@ -2,8 +2,11 @@
 BaseRunner - Abstract base class for job runners.
 """
 
+import threading
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+from ..job.job_state import JobState
 
 
 class BaseRunner(ABC):
@@ -23,6 +26,42 @@ class BaseRunner(ABC):
         """
         self.config = config or {}
 
+        # Signalled whenever a job reaches a terminal state, for runners that can push events
+        self._job_finished = threading.Condition()
+        self._num_finished_jobs = 0
+
+    def notify_job_finished(self) -> None:
+        """
+        Wake up everyone waiting in wait_for_finished_jobs.
+
+        Runners call this when they learn that a job finished without being polled.
+        """
+        with self._job_finished:
+            self._num_finished_jobs += 1
+            self._job_finished.notify_all()
+
+    def finished_job_count(self) -> int:
+        """
+        Get the number of finished-job notifications so far.
+
+        Returns:
+            The notification count, to pass to wait_for_finished_jobs
+        """
+        return self._num_finished_jobs
+
+    def wait_for_finished_jobs(self, seen: int, timeout: float) -> None:
+        """
+        Wait until a job finishes or the timeout expires.
+
+        Runners that cannot push events never notify, so this simply sleeps for the timeout.
+
+        Args:
+            seen: The finished_job_count() taken before the caller last checked job states
+            timeout: Maximum number of seconds to wait
+        """
+        with self._job_finished:
+            self._job_finished.wait_for(lambda: self._num_finished_jobs != seen, timeout=timeout)
+
     @abstractmethod
     def run_job(self, job) -> None:
         """
@@ -43,6 +82,24 @@ class BaseRunner(ABC):
         """
         pass
 
+    def check_status_batch(self, jobs: List) -> Dict[str, JobState]:
+        """
+        Check the status of several jobs in one polling cycle.
+
+        The default implementation checks the jobs one by one. Runners whose status
+        queries are expensive (a subprocess or a REST call per job) override this
+        to query all jobs at once.
+
+        Args:
+            jobs: The jobs to check
+
+        Returns:
+            Mapping of job id to the job state after the check
+        """
+        for job in jobs:
+            job.check_status()
+        return {job.job_id: job.state for job in jobs}
+
     @abstractmethod
     def cancel_job(self, job) -> None:
         """
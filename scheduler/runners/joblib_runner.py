@@ -10,13 +10,138 @@ import tempfile
 import json
 import shutil
 import traceback
-from typing import Dict, Any
+import runpy
+import shlex
+import sys
+import io
+from contextlib import redirect_stdout, redirect_stderr
+from typing import Dict, Any, Tuple
 from concurrent.futures import ThreadPoolExecutor
+from joblib.externals.loky import get_reusable_executor
 from ..job.job import JobType
 from ..job.job_state import JobState
 from .base_runner import BaseRunner
 
 
+def _effective_n_jobs(n_jobs: int) -> int:
+    """
+    Resolve n_jobs against the CPUs actually allocated to this process.
+
+    Negative values count back from the available CPUs as in joblib (-1 means all of them).
+    The available CPUs come from $SLURM_CPUS_PER_TASK when set, otherwise from the CPU
+    affinity mask, which unlike os.cpu_count() honors cgroup and taskset limits.
+
+    Args:
+        n_jobs: Requested number of parallel jobs
+
+    Returns:
+        The number of parallel jobs to use
+    """
+    slurm_cpus = os.environ.get("SLURM_CPUS_PER_TASK", "")
+    if slurm_cpus.isdigit() and int(slurm_cpus) > 0:
+        available = int(slurm_cpus)
+    elif hasattr(os, "sched_getaffinity"):
+        available = len(os.sched_getaffinity(0))
+    else:
+        available = os.cpu_count() or 1
+
+    if n_jobs < 0:
+        return max(1, available + 1 + n_jobs)
+    return max(1, n_jobs)
+
+
+def _run_python_script(script_path: str, env: Dict[str, str], working_dir: str) -> Tuple[int, str, str]:
+    """
+    Run a Python script inside the current (long-lived worker) process.
+
+    Like ``python script.py``, the script's directory is put first on sys.path, so it
+    can import sibling modules. Unlike a fresh interpreter, sys.modules is shared by all
+    scripts run in the same worker: a module imported by one script is not re-imported
+    by the next.
+
+    Args:
+        script_path: Path to the Python script
+        env: Environment to expose to the script
+        working_dir: Directory to run the script in
+
+    Returns:
+        Tuple of (exit code, stdout, stderr)
+    """
+    original_env = os.environ.copy()
+    original_dir = os.getcwd()
+    original_argv = sys.argv
+    original_path = sys.path[:]
+    script_dir = os.path.dirname(os.path.abspath(script_path))
+    stdout, stderr = io.StringIO(), io.StringIO()
+    returncode = 0
+    try:
+        os.environ.clear()
+        os.environ.update(env)
+        os.chdir(working_dir)
+        sys.argv = [script_path]
+        sys.path.insert(0, script_dir)
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                runpy.run_path(script_path, run_name="__main__")
+            except SystemExit as e:
+                if isinstance(e.code, int):
+                    returncode = e.code
+                elif e.code is not None:
+                    stderr.write(f"{e.code}\n")
+                    returncode = 1
+            except Exception:
+                stderr.write(traceback.format_exc())
+                returncode = 1
+    finally:
+        sys.argv = original_argv
+        sys.path[:] = original_path
+        os.chdir(original_dir)
+        os.environ.clear()
+        os.environ.update(original_env)
+    return returncode, stdout.getvalue(), stderr.getvalue()
+
+
+# Variables bash maintains itself, which a setup script does not mean to set
+_SHELL_BOOKKEEPING_VARS = frozenset(["PWD", "OLDPWD", "SHLVL", "_"])
+
+
+def _source_setup_script(setup_script: str) -> Dict[str, str]:
+    """
+    Source a shell setup script once and capture the variables it sets.
+
+    Only variables that are new or differ from os.environ at capture time are kept, so
+    layering them over the environment of a later job does not revert anything the
+    parent process changed after the capture.
+
+    Args:
+        setup_script: Path to the shell script to source
+
+    Returns:
+        The variables set or changed by the script
+    """
+    # Pass the path as a positional argument so the shell never parses it
+    output = subprocess.check_output(["bash", "-c", 'source "$1" >/dev/null && env -0', "bash", setup_script])
+    env = {}
+    for entry in output.split(b"\0"):
+        key, sep, value = entry.partition(b"=")
+        if not sep:
+            continue
+        key, value = key.decode(), value.decode()
+        if key not in _SHELL_BOOKKEEPING_VARS and os.environ.get(key) != value:
+            env[key] = value
+    return env
+
+
+def _init_worker_env(env: Dict[str, str]) -> None:
+    """
+    Initialize a worker process with a captured environment.
+
+    Args:
+        env: Environment variables to set
+    """
+    os.environ.update(env)
+
+
 class JobLibRunner(BaseRunner):
     """
     A runner that uses joblib for parallel execution.
@@ -33,21 +158,28 @@ class JobLibRunner(BaseRunner):
         Initialize a new JobLibRunner.
 
         Args:
-            n_jobs: Number of jobs to run in parallel (-1 for all cores)
+            n_jobs: Number of jobs to run in parallel (-1 for all cores allocated to this process)
             backend: Backend to use for joblib (loky, threading, multiprocessing)
             config: Additional configuration options:
                 container_engine: 'docker' or 'singularity' (default: 'docker')
                 tmp_dir: Directory for temporary files (default: system temp dir)
+                setup_script: Shell script sourced once when the runner is created; the resulting
+                    environment is applied to every function and script job (default: None)
+                persistent_workers: Run Python script jobs in a pool of long-lived worker
+                    processes instead of starting a new interpreter per job (default: False)
         """
         super().__init__(config or {})
-        self.n_jobs = n_jobs
+        self.n_jobs = _effective_n_jobs(n_jobs)
         self.backend = backend
         self.running_jobs = {}  # job_id -> future
-        self.executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+        self.executor = ThreadPoolExecutor(max_workers=self.n_jobs)
 
         # Container configuration
         self.container_engine = self.config.get("container_engine", "docker")
         self.tmp_dir = self.config.get("tmp_dir", tempfile.gettempdir())
+        self.persistent_workers = self.config.get("persistent_workers", False)
+        self.setup_script = self.config.get("setup_script")
+        self.setup_env = _source_setup_script(self.setup_script) if self.setup_script else {}
 
         # Ensure temp directory exists
         os.makedirs(self.tmp_dir, exist_ok=True)
@@ -55,6 +187,26 @@ class JobLibRunner(BaseRunner):
         self.num_checks = 0
         self.logger = logging.getLogger("JoblibRunner")
 
+        # Execution method per job type, looked up once per job in run_job
+        self._executors = {
+            JobType.FUNCTION: self._execute_function,
+            JobType.SCRIPT: self._execute_script,
+            JobType.CONTAINER: self._execute_container,
+        }
+
+    def _get_process_pool(self):
+        """
+        Get loky's reusable process pool, sized to n_jobs.
+
+        The pool is shared with joblib's loky backend and its workers stay alive between jobs.
+
+        Returns:
+            The reusable executor
+        """
+        if self.setup_env:
+            return get_reusable_executor(max_workers=self.n_jobs, initializer=_init_worker_env, initargs=(self.setup_env,))
+        return get_reusable_executor(max_workers=self.n_jobs)
+
     def _execute_function(self, job):
         """
         Execute a job's function with its parameters and update its state.
@@ -68,6 +220,7 @@ class JobLibRunner(BaseRunner):
         try:
             # Set environment variables
             original_env = os.environ.copy()
+            os.environ.update(self.setup_env)
             os.environ.update(job.env_vars)
 
             # Set working directory if specified
@@ -81,14 +234,19 @@ class JobLibRunner(BaseRunner):
                 # parallel = joblib.Parallel(n_jobs=self.n_jobs, backend=self.backend)
                 # results = parallel(joblib.delayed(job.function)(**job.params))
                 self.logger.info(f"To run job {job.job_id} function {job.function} with parameters: {job.params}")
-                results = joblib.Parallel(n_jobs=self.n_jobs, backend=self.backend)([joblib.delayed(job.function)(**job.params)])
-                # Process results and mark job as completed
-                if len(results) == 1:
-                    # result_dict = {"result": results[0]}
-                    result_dict = results[0]
+                if self.backend == "loky" and self.n_jobs > 1:
+                    # Submit the single call straight to loky's reusable process pool,
+                    # skipping the dispatch machinery of a one-task Parallel
+                    result_dict = self._get_process_pool().submit(job.function, **job.params).result()
                 else:
-                    # result_dict = {"results": results}
-                    result_dict = results
+                    results = joblib.Parallel(n_jobs=self.n_jobs, backend=self.backend)([joblib.delayed(job.function)(**job.params)])
+                    # Process results and mark job as completed
+                    if len(results) == 1:
+                        # result_dict = {"result": results[0]}
+                        result_dict = results[0]
+                    else:
+                        # result_dict = {"results": results}
+                        result_dict = results
 
                 # Collect any output files if specified
                 self._collect_output_files(job, result_dict)
@@ -103,9 +261,9 @@ class JobLibRunner(BaseRunner):
 
         except Exception as e:
             self.logger.error(f"Caught exception during execution job {job.job_id} function: {e}")
-            # job.fail(str(e))
             self.logger.error(traceback.format_exc())
-            return {"error": str(e)}
+            # Re-raise so check_job_status marks the job as failed
+            raise
 
     def _execute_script(self, job):
         """
@@ -116,6 +274,9 @@ class JobLibRunner(BaseRunner):
 
         Returns:
             The results of the script
+
+        Raises:
+            RuntimeError: If the script exits with a non-zero code
         """
         try:
             # Create a temporary directory for job execution
@@ -129,6 +290,7 @@ class JobLibRunner(BaseRunner):
 
             # Build environment variables
             env = os.environ.copy()
+            env.update(self.setup_env)
             env.update(job.env_vars)
             env["JOB_PARAMS_FILE"] = params_file
 
@@ -136,20 +298,16 @@ class JobLibRunner(BaseRunner):
             working_dir = job.working_dir if job.working_dir else job_dir
 
             # Execute the script
-            command = ["bash", job.script_path] if job.script_path.endswith(".sh") else ["python", job.script_path]
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                env=env,
-                cwd=working_dir,
-                text=True,
-            )
-
-            stdout, stderr = process.communicate()
+            if self.persistent_workers and not job.script_path.endswith(".sh"):
+                # Reuse a warm interpreter instead of paying interpreter startup per job
+                returncode, stdout, stderr = self._get_process_pool().submit(_run_python_script, os.path.abspath(job.script_path), env, working_dir).result()
+            else:
+                command = ["bash", job.script_path] if job.script_path.endswith(".sh") else ["python", job.script_path]
+                process = subprocess.run(command, capture_output=True, env=env, cwd=working_dir, text=True)
+                returncode, stdout, stderr = process.returncode, process.stdout, process.stderr
 
             # Check if the script was successful
-            if process.returncode == 0:
+            if returncode == 0:
                 # Try to load results from a result file
                 result_file = os.path.join(job_dir, "result.json")
                 if os.path.exists(result_file):
@@ -165,13 +323,7 @@ class JobLibRunner(BaseRunner):
                 # job.complete(result_dict)
                 return result_dict
             else:
-                error_msg = f"Script failed with exit code {process.returncode}. Error: {stderr}"
-                # job.fail(error_msg)
-                return {"error": error_msg}
-
-        except Exception as e:
-            # job.fail(str(e))
-            return {"error": str(e)}
+                raise RuntimeError(f"Script failed with exit code {returncode}. Error: {stderr}")
         finally:
             # Clean up temporary directory
             if os.path.exists(job_dir):
@@ -186,6 +338,9 @@ class JobLibRunner(BaseRunner):
 
         Returns:
             The results of the container execution
+
+        Raises:
+            RuntimeError: If the container exits with a non-zero code
         """
         try:
             # Create a temporary directory for job execution
@@ -218,7 +373,7 @@ class JobLibRunner(BaseRunner):
                 cmd.append(job.container_image)
 
                 if job.container_command:
-                    cmd.extend(job.container_command.split())
+                    cmd.extend(shlex.split(job.container_command))
 
             elif self.container_engine == "singularity":
                 # Singularity command
@@ -246,9 +401,8 @@ class JobLibRunner(BaseRunner):
                 raise ValueError(f"Unsupported container engine: {self.container_engine}")
 
             # Execute the container
-            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-
-            stdout, stderr = process.communicate()
+            process = subprocess.run(cmd, capture_output=True, text=True)
+            stdout, stderr = process.stdout, process.stderr
 
             # Check if the container execution was successful
             if process.returncode == 0:
@@ -267,13 +421,7 @@ class JobLibRunner(BaseRunner):
                 # job.complete(result_dict)
                 return result_dict
             else:
-                error_msg = f"Container execution failed with exit code {process.returncode}. Error: {stderr}"
-                # job.fail(error_msg)
-                return {"error": error_msg}
-
-        except Exception as e:
-            # job.fail(str(e))
-            return {"error": str(e)}
+                raise RuntimeError(f"Container execution failed with exit code {process.returncode}. Error: {stderr}")
         finally:
             # Clean up temporary directory
             if os.path.exists(job_dir):
@@ -316,16 +464,13 @@ class JobLibRunner(BaseRunner):
         """
         # Submit the job to our executor
         self.logger.info(f"Start to run job {job.job_id}")
-        if job.job_type == JobType.FUNCTION:
-            future = self.executor.submit(self._execute_function, job)
-        elif job.job_type == JobType.SCRIPT:
-            future = self.executor.submit(self._execute_script, job)
-        elif job.job_type == JobType.CONTAINER:
-            future = self.executor.submit(self._execute_container, job)
-        else:
+        execute = self._executors.get(job.job_type)
+        if execute is None:
             job.fail(f"Unsupported job type: {job.job_type}")
             return
 
+        future = self.executor.submit(execute, job)
+        future.add_done_callback(lambda _: self.notify_job_finished())
         self.running_jobs[job.job_id] = future
 
     def check_job_status(self, job) -> None:
@@ -343,13 +488,12 @@ class JobLibRunner(BaseRunner):
             return
 
         if future.done():
-            if future.exception():
-                job.fail(str(future.exception()))
-            else:
-                # The job should have been marked as completed in _execute_* methods
-                # but we'll check just in case
-                if job.state != JobState.COMPLETED:
-                    job.complete(future.result())
+            # _execute_* raise on failure, so the future itself says whether the job failed
+            error = future.exception()
+            if error is not None:
+                job.fail(str(error))
+            elif job.state != JobState.COMPLETED:
+                job.complete(future.result())
 
             # Remove from running jobs
             self.running_jobs.pop(job.job_id, None)
@@ -3,10 +3,11 @@ SlurmRunner - Runner that submits jobs to a Slurm cluster.
 """
 
 import os
+import shlex
 import subprocess
 import pickle
 import json
-from typing import Dict, Any
+from typing import Dict, Any, List
 from ..job.job import JobType
 from ..job.job_state import JobState
 from .base_runner import BaseRunner
@@ -42,7 +43,8 @@ class SlurmRunner(BaseRunner):
             config: Additional configuration options:
                 modules: List of modules to load (default: ['python'])
                 singularity_path: Path to singularity executable (default: 'singularity')
-                job_dir: Directory to store job files (default: ~/slurm_jobs)
+                job_dir: Directory to store job files (default: ~/slurm_jobs). Submitted Slurm job ids
+                    are recorded here as well, so every process sharing the directory sees the same jobs.
         """
         super().__init__(config or {})
         self.partition = partition
@@ -191,10 +193,10 @@ class SlurmRunner(BaseRunner):
 
                 # Add command if specified
                 if job.container_command:
-                    cmd.extend(job.container_command.split())
+                    cmd.extend(shlex.split(job.container_command))
 
                 # Write the command to the script
-                f.write(f"{' '.join(cmd)}\n")
+                f.write(f"{shlex.join(cmd)}\n")
 
                 # Capture the exit code
                 f.write("EXIT_CODE=$?\n")
@@ -260,6 +262,43 @@ class SlurmRunner(BaseRunner):
         os.chmod(script_path, 0o755)
         return script_path
 
+    def _record_slurm_job_id(self, job, slurm_job_id: str) -> None:
+        """
+        Record the Slurm job id of a job in memory and in its job directory.
+
+        Args:
+            job: The submitted job
+            slurm_job_id: The id assigned by Slurm
+        """
+        self.jobs[job.job_id] = slurm_job_id
+
+        # Write atomically so concurrent readers never see a partial id
+        id_path = os.path.join(self.job_dir, job.job_id, "slurm_job_id")
+        tmp_path = f"{id_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(slurm_job_id)
+        os.replace(tmp_path, id_path)
+
+    def _lookup_slurm_job_id(self, job):
+        """
+        Find the Slurm job id of a job, also if it was submitted by another process.
+
+        Args:
+            job: The job to look up
+
+        Returns:
+            The Slurm job id, or None if the job was never submitted
+        """
+        slurm_job_id = self.jobs.get(job.job_id)
+        if slurm_job_id is None:
+            try:
+                with open(os.path.join(self.job_dir, job.job_id, "slurm_job_id"), "r") as f:
+                    slurm_job_id = f.read().strip()
+            except FileNotFoundError:
+                return None
+            self.jobs[job.job_id] = slurm_job_id
+        return slurm_job_id
+
     def run_job(self, job) -> None:
         """
         Submit a job to Slurm.
@@ -275,7 +314,7 @@ class SlurmRunner(BaseRunner):
 
             # Extract the job ID (format: "Submitted batch job 123456")
             slurm_job_id = result.stdout.strip().split()[-1]
-            self.jobs[job.job_id] = slurm_job_id
+            self._record_slurm_job_id(job, slurm_job_id)
 
             # Update job state
             job.state = JobState.RUNNING
@@ -290,7 +329,7 @@ class SlurmRunner(BaseRunner):
         Args:
             job: The job to check
         """
-        slurm_job_id = self.jobs.get(job.job_id)
+        slurm_job_id = self._lookup_slurm_job_id(job)
         if slurm_job_id is None:
             return
 
@@ -303,35 +342,91 @@ class SlurmRunner(BaseRunner):
                 job.state = JobState.RUNNING
                 return
 
-            # Job has finished, check if it completed successfully
-            job_path = os.path.join(self.job_dir, job.job_id)
-            result_path = os.path.join(job_path, "result.json")
-            error_path = os.path.join(job_path, "error.json")
-
-            if os.path.exists(result_path):
-                with open(result_path, "r") as f:
-                    results = json.load(f)
-                job.complete(results)
-            elif os.path.exists(error_path):
-                with open(error_path, "r") as f:
-                    error = json.load(f)
-                job.fail(error.get("error", "Unknown error"))
+            self._finalize_job(job, slurm_job_id)
+
+        except subprocess.CalledProcessError as e:
+            job.fail(f"Failed to check job status: {e.stderr}")
+
+    def check_status_batch(self, jobs: List) -> Dict[str, JobState]:
+        """
+        Check the status of several jobs with a single squeue call.
+
+        Jobs that are not running Slurm submissions (e.g. multi-step jobs) are
+        checked one by one.
+
+        Args:
+            jobs: The jobs to check
+
+        Returns:
+            Mapping of job id to the job state after the check
+        """
+        slurm_jobs = {}
+        for job in jobs:
+            slurm_job_id = None
+            if job.is_running() and job.return_func_results:
+                slurm_job_id = self._lookup_slurm_job_id(job)
+            if slurm_job_id is None:
+                job.check_status()
             else:
-                # Check the exit code
-                sacct_result = subprocess.run(
-                    ["sacct", "-j", slurm_job_id, "-o", "ExitCode", "-n"],
+                slurm_jobs[slurm_job_id] = job
+
+        if slurm_jobs:
+            try:
+                result = subprocess.run(
+                    ["squeue", "--jobs=" + ",".join(slurm_jobs), "-h", "-o", "%i"],
                     capture_output=True,
                     text=True,
                 )
-                exit_code = sacct_result.stdout.strip().split()[0]
-
-                if exit_code == "0:0":
-                    job.complete({"result": "Job completed but no results found"})
+                if result.returncode != 0:
+                    # squeue rejects the whole list if one id is unknown, fall back to one query per job
+                    for job in slurm_jobs.values():
+                        self.check_job_status(job)
                 else:
-                    job.fail(f"Job failed with exit code {exit_code}")
+                    queued = set(result.stdout.split())
+                    for slurm_job_id, job in slurm_jobs.items():
+                        if slurm_job_id in queued:
+                            job.state = JobState.RUNNING
+                        else:
+                            self._finalize_job(job, slurm_job_id)
+            except subprocess.CalledProcessError as e:
+                for job in slurm_jobs.values():
+                    job.fail(f"Failed to check job status: {e.stderr}")
+
+        return {job.job_id: job.state for job in jobs}
+
+    def _finalize_job(self, job, slurm_job_id: str) -> None:
+        """
+        Complete or fail a job that has left the Slurm queue.
 
-        except subprocess.CalledProcessError as e:
-            job.fail(f"Failed to check job status: {e.stderr}")
+        Args:
+            job: The finished job
+            slurm_job_id: The Slurm job id of the job
+        """
+        job_path = os.path.join(self.job_dir, job.job_id)
+        result_path = os.path.join(job_path, "result.json")
+        error_path = os.path.join(job_path, "error.json")
+
+        if os.path.exists(result_path):
+            with open(result_path, "r") as f:
+                results = json.load(f)
+            job.complete(results)
+        elif os.path.exists(error_path):
+            with open(error_path, "r") as f:
+                error = json.load(f)
+            job.fail(error.get("error", "Unknown error"))
+        else:
+            # Check the exit code
+            sacct_result = subprocess.run(
+                ["sacct", "-j", slurm_job_id, "-o", "ExitCode", "-n"],
+                capture_output=True,
+                text=True,
+            )
+            exit_code = sacct_result.stdout.strip().split()[0]
+
+            if exit_code == "0:0":
+                job.complete({"result": "Job completed but no results found"})
+            else:
+                job.fail(f"Job failed with exit code {exit_code}")
 
     def cancel_job(self, job) -> None:
         """
@@ -340,7 +435,7 @@ class SlurmRunner(BaseRunner):
         Args:
             job: The job to cancel
         """
-        slurm_job_id = self.jobs.get(job.job_id)
+        slurm_job_id = self._lookup_slurm_job_id(job)
         if slurm_job_id is None:
             return
 
@@ -8,6 +8,7 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 from .trial_state import TrialState
 from ..job.job import Job
+from ..job.job_state import JobState
 
 
 class Trial:
@@ -67,6 +68,15 @@ class Trial:
         for job in self.jobs:
             job.check_status()
 
+        return self.update_state()
+
+    def update_state(self) -> TrialState:
+        """
+        Update the trial state from the current job states, without polling the jobs.
+
+        Returns:
+            The current state of the trial
+        """
         # If any job is still running, the trial is running
         if any(job.is_running() for job in self.jobs):
             self.state = TrialState.RUNNING
@@ -80,6 +90,11 @@ class Trial:
             self.state = TrialState.FAILED
             if not self.end_time:
                 self.end_time = datetime.now()
+        # If the other jobs were cancelled, the trial is cancelled
+        elif any(job.state == JobState.CANCELLED for job in self.jobs):
+            self.state = TrialState.CANCELLED
+            if not self.end_time:
+                self.end_time = datetime.now()
 
         if self.num_checks % 60 == 0:
             self.logger.info(f"Checking trial {self.trial_id} status: {self.state}")
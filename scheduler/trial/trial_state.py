@@ -19,4 +19,4 @@ class TrialState(Enum):
     CANCELLED = auto()
 
     def __str__(self):
-        return self.name
+        return self._name_
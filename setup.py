@@ -13,6 +13,7 @@ setup(
     extras_require={
         "slurm": ["drmaa"],  # Optional dependency for Slurm support
         "panda": ["panda-client"],  # Optional dependency for PanDA support
+        "fast-json": ["orjson"],  # Optional faster experiment save/load
     },
     author="Your Name",
     author_email="your.email@example.com",
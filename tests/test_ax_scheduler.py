@@ -0,0 +1,213 @@
+"""
+Tests for the AxScheduler module.
+"""
+
+import math
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from ax.core.trial import Trial as AxTrial
+from ax.exceptions.core import DataRequiredError
+from ax.exceptions.generation_strategy import MaxParallelismReachedException
+from ax.service.ax_client import AxClient, ObjectiveProperties
+
+from scheduler.ax_scheduler import AxScheduler
+from scheduler.job.job_state import JobState
+from scheduler.runners.base_runner import BaseRunner
+from scheduler.runners.joblib_runner import JobLibRunner
+
+
+def objective(x, outcome="completed", checks=1):
+    if outcome == "failed":
+        raise ValueError("objective failed")
+    return {"objective": x}
+
+
+def batch_objective(parameterizations):
+    return [objective(**parameters) for parameters in parameterizations]
+
+
+class StubRunner(BaseRunner):
+    """Runner that finishes a job after params["checks"] status checks, without running anything in the background."""
+
+    def __init__(self):
+        super().__init__()
+        self.num_checks = {}
+        self.num_running = 0
+        self.max_running = 0
+
+    def run_job(self, job):
+        self.num_checks[job.job_id] = 0
+        self.num_running += 1
+        self.max_running = max(self.max_running, self.num_running)
+
+    def check_job_status(self, job):
+        self.num_checks[job.job_id] += 1
+        if self.num_checks[job.job_id] < job.params.get("checks", 1):
+            return
+        self.num_running -= 1
+        if job.params.get("outcome") == "cancelled":
+            job.state = JobState.CANCELLED
+            return
+        try:
+            job.complete(job.function(**job.params))
+        except Exception as e:
+            job.fail(str(e))
+
+    def cancel_job(self, job):
+        job.state = JobState.CANCELLED
+
+
+def make_ax_client(responses):
+    """
+    Create a mocked AxClient whose get_next_trials returns the next item of responses.
+
+    Each response is a list of parameterizations to create trials for, or an exception to raise.
+    """
+    ax_client = mock.MagicMock(spec=AxClient)
+    ax_client.experiment = mock.MagicMock()
+    ax_client.experiment.trials = {}
+    ax_client.get_best_parameters.return_value = ({"x": 0}, None)
+    responses = list(responses)
+
+    def get_next_trials(max_trials):
+        response = responses.pop(0) if responses else []
+        if isinstance(response, Exception):
+            raise response
+        batch = {}
+        for parameters in response[:max_trials]:
+            trial_index = len(ax_client.experiment.trials)
+            ax_trial = mock.MagicMock(spec=AxTrial)
+            ax_trial.index = trial_index
+            ax_trial.arm = SimpleNamespace(parameters=parameters, signature=repr(sorted(parameters.items())), name=f"{trial_index}_0")
+            ax_client.experiment.trials[trial_index] = ax_trial
+            batch[trial_index] = parameters
+        return batch, False
+
+    ax_client.get_next_trials.side_effect = get_next_trials
+    return ax_client
+
+
+class TestAxScheduler(unittest.TestCase):
+    """Tests for the AxScheduler class."""
+
+    def setUp(self):
+        self.output_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.output_dir.cleanup)
+        self.runner = StubRunner()
+
+    def make_scheduler(self, ax_client, **config):
+        config.setdefault("monitoring_interval", 0)
+        config["job_output_dir"] = self.output_dir.name
+        scheduler = AxScheduler(ax_client, self.runner, config=config)
+        scheduler.set_objective_function(objective)
+        return scheduler
+
+    def test_finished_trials_leave_active_trials(self):
+        """Test that completed and failed trials are no longer tracked as active."""
+        ax_client = make_ax_client([[{"x": 1}, {"x": 2, "outcome": "failed"}]])
+        scheduler = self.make_scheduler(ax_client, max_parallel_trials=2)
+
+        scheduler.run_optimization(max_trials=2)
+
+        self.assertEqual(scheduler._active_trials, set())
+        ax_client.complete_trial.assert_called_once_with(trial_index=0, raw_data={"objective": 1})
+        ax_client.log_trial_failure.assert_called_once_with(trial_index=1)
+
+    def test_run_optimization_keeps_max_parallel_trials_in_flight(self):
+        """Test that run_optimization never runs more than max_parallel_trials trials at once."""
+        ax_client = make_ax_client([[{"x": i, "checks": i % 3 + 1} for i in range(6)]] * 6)
+        scheduler = self.make_scheduler(ax_client, max_parallel_trials=2)
+
+        scheduler.run_optimization(max_trials=5)
+
+        self.assertEqual(self.runner.max_running, 2)
+        self.assertTrue(all(call.kwargs["max_trials"] <= 2 for call in ax_client.get_next_trials.call_args_list))
+        completed = sorted(call.kwargs["trial_index"] for call in ax_client.complete_trial.call_args_list)
+        self.assertEqual(completed, [0, 1, 2, 3, 4])
+
+    def test_run_optimization_waits_while_generation_is_blocked(self):
+        """Test that Ax refusing to generate trials pauses generation until a running trial finishes."""
+        for error in [MaxParallelismReachedException(num_running=1), DataRequiredError("need data")]:
+            with self.subTest(error=type(error).__name__):
+                self.runner = StubRunner()
+                ax_client = make_ax_client([[{"x": 0}, {"x": 1, "checks": 3}], error, [{"x": 2}]])
+                scheduler = self.make_scheduler(ax_client, max_parallel_trials=2)
+
+                scheduler.run_optimization(max_trials=3)
+
+                # Trial 0 finishes first, Ax then refuses once, and is only asked again after trial 1 finished
+                self.assertEqual(ax_client.get_next_trials.call_count, 3)
+                completed = sorted(call.kwargs["trial_index"] for call in ax_client.complete_trial.call_args_list)
+                self.assertEqual(completed, [0, 1, 2])
+
+    def test_run_optimization_reports_failed_and_cancelled_trials(self):
+        """Test that failed trials are logged as failures and cancelled trials are abandoned in Ax."""
+        ax_client = make_ax_client([[{"x": 0, "outcome": "failed"}, {"x": 1, "outcome": "cancelled"}, {"x": 2}]])
+        scheduler = self.make_scheduler(ax_client, max_parallel_trials=3)
+
+        scheduler.run_optimization(max_trials=3)
+
+        ax_client.log_trial_failure.assert_called_once_with(trial_index=0)
+        ax_client.abandon_trial.assert_called_once_with(trial_index=1, reason="jobs cancelled")
+        ax_client.complete_trial.assert_called_once_with(trial_index=2, raw_data={"objective": 2})
+
+    def test_run_optimization_with_batch_objective(self):
+        """Test that batches stay within max_parallel_trials, complete their trials and survive a failed batch."""
+        ax_client = make_ax_client([
+            [{"x": 0}, {"x": 1}],
+            [{"x": 2}, {"x": 3, "outcome": "failed"}],
+            [{"x": 0}, {"x": 4}],
+        ])
+        scheduler = self.make_scheduler(ax_client, max_parallel_trials=2, cache_results=True)
+        scheduler.set_batch_objective_function(batch_objective)
+
+        scheduler.run_optimization(max_trials=6)
+
+        self.assertEqual([call.kwargs["max_trials"] for call in ax_client.get_next_trials.call_args_list], [2, 2, 2])
+        self.assertEqual(self.runner.max_running, 1)
+        ax_client.log_trial_failure.assert_has_calls([mock.call(trial_index=2), mock.call(trial_index=3)])
+        completed = sorted(call.kwargs["trial_index"] for call in ax_client.complete_trial.call_args_list)
+        self.assertEqual(completed, [0, 1, 4, 5])
+        # Trial 4 repeats the arm of trial 0, so the last batch job only scores trial 5
+        self.assertEqual(len(self.runner.num_checks), 3)
+        self.assertEqual(scheduler.get_cached_results(4), {"objective": 0})
+        self.assertEqual(scheduler.get_cached_results(5), {"objective": 4})
+        self.assertEqual(scheduler._active_trials, set())
+
+    def test_job_ids_are_unique_across_schedulers(self):
+        """Test that schedulers in the same process, or with the same pid elsewhere, never reuse job ids."""
+        job_ids = set()
+        for _ in range(2):
+            ax_client = make_ax_client([[{"x": 0}, {"x": 1}]])
+            scheduler = self.make_scheduler(ax_client, max_parallel_trials=2)
+            scheduler.run_optimization(max_trials=2)
+            job_ids.update(job.job_id for trial in scheduler.trials.values() for job in trial.jobs)
+        self.assertEqual(len(job_ids), 4)
+
+    def test_save_and_load_experiment_keeps_nan(self):
+        """Test that NaN values survive saving and loading an experiment."""
+        ax_client = AxClient(verbose_logging=False)
+        ax_client.create_experiment(
+            name="test_experiment",
+            parameters=[{"name": "x", "type": "range", "bounds": [0.0, 1.0]}],
+            objectives={"objective": ObjectiveProperties(minimize=True)},
+        )
+        _, trial_index = ax_client.attach_trial(parameters={"x": 0.5})
+        ax_client.complete_trial(trial_index=trial_index, raw_data={"objective": (1.0, None)})
+        ax_client.experiment.trials[trial_index].update_run_metadata({"efficiency": float("nan")})
+        scheduler = AxScheduler(ax_client, JobLibRunner(n_jobs=1), config={"job_output_dir": self.output_dir.name})
+        path = os.path.join(self.output_dir.name, "experiment.json")
+
+        scheduler.save_experiment(path)
+        scheduler.load_experiment(path)
+
+        self.assertTrue(math.isnan(scheduler.experiment.trials[trial_index].run_metadata["efficiency"]))
+        self.assertTrue(math.isnan(scheduler.experiment.lookup_data().df["sem"].iloc[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+"""
+Tests for the example objective functions.
+"""
+
+import importlib.util
+import os
+import unittest
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples")
+
+
+def load_example(name):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(EXAMPLES_DIR, f"{name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestDetectorOptimization(unittest.TestCase):
+    """Tests for the detector optimization example."""
+
+    def test_optimization_function_batch(self):
+        """Test that the batch objective returns the per-trial metrics for each parameterization."""
+        example = load_example("detector_optimization")
+        parameterizations = [
+            {"field_strength": 0.5, "detector_length": 3.0, "detector_radius": 0.8},
+            {"field_strength": 1.5, "detector_length": 5.0, "detector_radius": 1.2},
+            {"field_strength": 3.0, "detector_length": 8.0, "detector_radius": 2.5},
+        ]
+
+        results = example.optimization_function_batch(parameterizations)
+
+        self.assertEqual(len(results), len(parameterizations))
+        for parameterization, metrics in zip(parameterizations, results):
+            expected = example.optimization_function(parameterization)
+            self.assertEqual(set(metrics), {"resolution", "acceptance", "cost"})
+            for name, value in metrics.items():
+                self.assertIsInstance(value, float)
+                self.assertAlmostEqual(value, expected[name])
+
+    def test_optimization_function_batch_empty(self):
+        """Test that an empty batch gives no results."""
+        example = load_example("detector_optimization")
+        self.assertEqual(example.optimization_function_batch([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Tests for the job module.
+"""
+
+import time
+import unittest
+from scheduler.job.job import JobType
+from scheduler.job.job_state import JobState
+from scheduler.job.multi_steps_job import MultiStepsFunction, MultiStepsJob
+from scheduler.runners.joblib_runner import JobLibRunner
+
+
+def step_function(x):
+    return {"value": x}
+
+
+class TestMultiStepsJob(unittest.TestCase):
+    """Tests for the MultiStepsJob class."""
+
+    def test_validate_requires_function(self):
+        """Test that a multi-step job without a function is rejected."""
+        with self.assertRaisesRegex(ValueError, "Function must be provided"):
+            MultiStepsJob(job_id="test_job", job_type=JobType.MULTISTEPSFUNCTION, function=None)
+
+    def test_validate_requires_multi_steps_function(self):
+        """Test that a multi-step job with a plain function is rejected."""
+        with self.assertRaisesRegex(ValueError, "MultiStepsFunction must be provided"):
+            MultiStepsJob(job_id="test_job", job_type=JobType.MULTISTEPSFUNCTION, function=print)
+
+    def test_steps_run_in_dependency_order(self):
+        """Test that steps become ready once their parent step is done."""
+        runner = JobLibRunner(n_jobs=1, backend="threading")
+        function = MultiStepsFunction(
+            objective_funcs={
+                "sim": {"func": step_function, "job_type": JobType.FUNCTION, "runner": runner, "return_func_results": False},
+                "reco": {"func": step_function, "job_type": JobType.FUNCTION, "runner": runner},
+                "ana": {"func": step_function, "job_type": JobType.FUNCTION, "runner": runner},
+            },
+            deps={"reco": "sim", "ana": "reco"},
+        )
+        job = MultiStepsJob(job_id="test_job", function=function, params={"x": 1}, trial_id="test_trial")
+        job.set_runner(runner)
+        self.assertEqual(job.get_ready_steps(), ["sim"])
+
+        job.run()
+        waited = 0
+        while job.state == JobState.RUNNING and waited < 10:
+            time.sleep(0.1)
+            waited += 0.1
+            job.check_status()
+
+        self.assertEqual(job.state, JobState.COMPLETED)
+        self.assertEqual(job.get_results(), {"value": 1})
+        self.assertEqual(job.step_states["ana"]["state"], JobState.COMPLETED)
+
+    def test_longest_chain_runs_first(self):
+        """Test that the ready step heading the longest chain of dependent steps comes first."""
+        runner = JobLibRunner(n_jobs=1, backend="threading")
+        function = MultiStepsFunction(
+            objective_funcs={
+                name: {"func": step_function, "job_type": JobType.FUNCTION, "runner": runner}
+                for name in ["plot", "sim", "reco", "ana"]
+            },
+            deps={"reco": "sim", "ana": "reco"},
+        )
+        job = MultiStepsJob(job_id="test_job", function=function, params={"x": 1})
+        self.assertEqual(job.get_ready_steps(), ["sim", "plot"])
+
+    def test_step_jobs_do_not_share_params(self):
+        """Test that changing nested params of one step job leaves its siblings unchanged."""
+        runner = JobLibRunner(n_jobs=1, backend="threading")
+        function = MultiStepsFunction(
+            objective_funcs={
+                "sim": {"func": step_function, "job_type": JobType.FUNCTION, "runner": runner},
+                "ana": {"func": step_function, "job_type": JobType.FUNCTION, "runner": runner},
+            },
+            global_parameters={"g": [1, 2]},
+            global_parameters_steps=["sim"],
+        )
+        params = {"x": 1, "cfg": {"tags": ["a"]}}
+        job = MultiStepsJob(job_id="test_job", function=function, params=params, trial_id="test_trial")
+        step_jobs = [step_job for jobs in job.step_jobs.values() for step_job in jobs.values()]
+        self.assertEqual(len(step_jobs), 3)
+
+        step_jobs[0].params["cfg"]["tags"].append("b")
+        step_jobs[0].input_datasets["in"] = "dataset"
+
+        for step_job in step_jobs[1:]:
+            self.assertEqual(step_job.params["cfg"], {"tags": ["a"]})
+            self.assertEqual(step_job.input_datasets, {})
+        self.assertEqual(params["cfg"], {"tags": ["a"]})
+
+    def test_final_step(self):
+        """Test that an explicit final step is used and defaults to the last step."""
+        runner = JobLibRunner(n_jobs=1, backend="threading")
+        objective_funcs = {
+            "sim": {"func": step_function, "job_type": JobType.FUNCTION, "runner": runner},
+            "ana": {"func": step_function, "job_type": JobType.FUNCTION, "runner": runner},
+        }
+        job = MultiStepsJob(job_id="test_job", function=MultiStepsFunction(objective_funcs=objective_funcs), params={"x": 1})
+        self.assertEqual(job.final, "ana")
+        job = MultiStepsJob(job_id="test_job", function=MultiStepsFunction(objective_funcs=objective_funcs, final="sim"), params={"x": 1})
+        self.assertEqual(job.final, "sim")
+        with self.assertRaisesRegex(ValueError, "Final step"):
+            MultiStepsJob(job_id="test_job", function=MultiStepsFunction(objective_funcs=objective_funcs, final="reco"), params={"x": 1})
+
+    def test_unsupported_dep_map(self):
+        """Test that an unknown dep_map is rejected when the job is built."""
+        runner = JobLibRunner(n_jobs=1, backend="threading")
+        function = MultiStepsFunction(
+            objective_funcs={
+                "sim": {"func": step_function, "job_type": JobType.FUNCTION, "runner": runner},
+                "ana": {"func": step_function, "job_type": JobType.FUNCTION, "runner": runner},
+            },
+            deps={"ana": {"parent": "sim", "dep_map": "many2many"}},
+        )
+        with self.assertRaisesRegex(ValueError, "unsupported dep_map"):
+            MultiStepsJob(job_id="test_job", function=function, params={"x": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,11 +2,17 @@
 Tests for the runners module.
 """
 
+import os
+import sys
+import tempfile
+import textwrap
 import unittest
 import time
-from scheduler.job.job import Job
+from unittest import mock
+from scheduler.job.job import Job, JobType
 from scheduler.job.job_state import JobState
-from scheduler.runners.joblib_runner import JobLibRunner
+from scheduler.runners.joblib_runner import JobLibRunner, _run_python_script, _source_setup_script
+from scheduler.runners.slurm_runner import SlurmRunner
 
 
 class TestJobLibRunner(unittest.TestCase):
@@ -92,6 +98,213 @@ class TestJobLibRunner(unittest.TestCase):
         # Check that the job was cancelled
         self.assertEqual(job.state, JobState.CANCELLED)
 
+    def test_wait_for_finished_jobs_wakes_up_early(self):
+        """Test that waiting for finished jobs returns as soon as a job finishes."""
+
+        def short_function():
+            time.sleep(0.2)
+            return {"done": True}
+
+        runner = JobLibRunner(n_jobs=1, backend="threading")
+        job = Job(job_id="test_notify_job", job_type=JobType.FUNCTION, function=short_function)
+        job.set_runner(runner)
+        seen = runner.finished_job_count()
+        job.run()
+
+        start = time.time()
+        runner.wait_for_finished_jobs(seen, timeout=30)
+        self.assertLess(time.time() - start, 10)
+        self.assertGreater(runner.finished_job_count(), seen)
+
+        runner.check_job_status(job)
+        self.assertEqual(job.state, JobState.COMPLETED)
+
+    def test_n_jobs_honors_slurm_allocation(self):
+        """Test that n_jobs=-1 resolves to the CPUs Slurm allocated, not the node total."""
+        with mock.patch.dict(os.environ, {"SLURM_CPUS_PER_TASK": "3"}):
+            self.assertEqual(JobLibRunner(n_jobs=-1).n_jobs, 3)
+            self.assertEqual(JobLibRunner(n_jobs=-2).n_jobs, 2)
+            self.assertEqual(JobLibRunner(n_jobs=8).n_jobs, 8)
+
+    def test_failed_function_job_is_marked_failed(self):
+        """Test that an exception in a function job fails the job instead of completing it."""
+
+        def failing_function(x):
+            raise ValueError("Test error")
+
+        job = Job(job_id="test_job_4", job_type=JobType.FUNCTION, function=failing_function, params={"x": 1})
+        runner = JobLibRunner(n_jobs=1, backend="threading")
+        job.set_runner(runner)
+        job.run()
+
+        waited = 0
+        while job.state == JobState.RUNNING and waited < 10:
+            time.sleep(0.1)
+            waited += 0.1
+            runner.check_job_status(job)
+
+        self.assertEqual(job.state, JobState.FAILED)
+        self.assertIn("Test error", job.get_results()["error"])
+
+    def test_failed_script_job_is_marked_failed(self):
+        """Test that a script exiting with an error fails the job and keeps its stderr."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            script_path = os.path.join(tmp_dir, "fail.sh")
+            with open(script_path, "w") as f:
+                f.write('echo "simulation crashed" >&2\nexit 3\n')
+
+            runner = JobLibRunner(config={"tmp_dir": tmp_dir})
+            job = Job(job_id="test_failing_script", job_type=JobType.SCRIPT, script_path=script_path)
+            job.set_runner(runner)
+            job.run()
+
+            waited = 0
+            while job.state == JobState.RUNNING and waited < 10:
+                time.sleep(0.1)
+                waited += 0.1
+                runner.check_job_status(job)
+
+            self.assertEqual(job.state, JobState.FAILED)
+            self.assertIn("exit code 3", job.get_results()["error"])
+            self.assertIn("simulation crashed", job.get_results()["error"])
+
+    def test_setup_script_environment(self):
+        """Test that the setup script environment reaches function jobs in worker processes."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            setup_script = os.path.join(tmp_dir, "setup.sh")
+            with open(setup_script, "w") as f:
+                f.write('export EPIC_SETUP="sourced once"\n')
+
+            def read_env():
+                return {"setup": os.environ.get("EPIC_SETUP")}
+
+            runner = JobLibRunner(n_jobs=2, config={"tmp_dir": tmp_dir, "setup_script": setup_script})
+            self.assertEqual(runner.setup_env["EPIC_SETUP"], "sourced once")
+
+            job = Job(job_id="test_setup_job", job_type=JobType.FUNCTION, function=read_env)
+            job.set_runner(runner)
+            job.run()
+
+            waited = 0
+            while job.state == JobState.RUNNING and waited < 30:
+                time.sleep(0.1)
+                waited += 0.1
+                runner.check_job_status(job)
+
+            self.assertEqual(job.state, JobState.COMPLETED)
+            self.assertEqual(job.get_results(), {"setup": "sourced once"})
+
+    def test_run_script_job_persistent_workers(self):
+        """Test running Python script jobs in long-lived worker processes."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            script_path = os.path.join(tmp_dir, "objective.py")
+            with open(script_path, "w") as f:
+                f.write(
+                    textwrap.dedent(
+                        """
+                        import json
+                        import os
+
+                        with open(os.environ["JOB_PARAMS_FILE"]) as f:
+                            params = json.load(f)
+                        result_file = os.path.join(os.path.dirname(os.environ["JOB_PARAMS_FILE"]), "result.json")
+                        with open(result_file, "w") as f:
+                            json.dump({"objective": params["x"] * 2}, f)
+                        """
+                    )
+                )
+
+            runner = JobLibRunner(n_jobs=2, config={"tmp_dir": tmp_dir, "persistent_workers": True})
+            jobs = []
+            for i in range(3):
+                job = Job(job_id=f"test_script_job_{i}", job_type=JobType.SCRIPT, script_path=script_path, params={"x": i})
+                job.set_runner(runner)
+                job.run()
+                jobs.append(job)
+
+            for job in jobs:
+                waited = 0
+                while job.state == JobState.RUNNING and waited < 30:
+                    time.sleep(0.1)
+                    waited += 0.1
+                    runner.check_job_status(job)
+
+            self.assertEqual([job.state for job in jobs], [JobState.COMPLETED] * 3)
+            self.assertEqual([job.get_results()["objective"] for job in jobs], [0, 2, 4])
+
+    def test_run_python_script_imports_sibling_module(self):
+        """Test that an in-process script can import modules next to it, as with python script.py."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(os.path.join(tmp_dir, "sibling_helper.py"), "w") as f:
+                f.write("VALUE = 42\n")
+            script_path = os.path.join(tmp_dir, "objective.py")
+            with open(script_path, "w") as f:
+                f.write("import sibling_helper\nprint(sibling_helper.VALUE)\n")
+            original_path = sys.path[:]
+
+            returncode, stdout, stderr = _run_python_script(script_path, dict(os.environ), tmp_dir)
+
+        self.assertEqual((returncode, stdout, stderr), (0, "42\n", ""))
+        self.assertEqual(sys.path, original_path)
+        sys.modules.pop("sibling_helper", None)
+
+    def test_source_setup_script_keeps_only_changed_variables(self):
+        """Test that only variables the setup script sets or changes are captured."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            setup_script = os.path.join(tmp_dir, "setup.sh")
+            with open(setup_script, "w") as f:
+                f.write('export EPIC_SETUP=1\nexport PATH="/opt/epic/bin:$PATH"\ncd /\n')
+
+            env = _source_setup_script(setup_script)
+
+        self.assertEqual(env, {"EPIC_SETUP": "1", "PATH": "/opt/epic/bin:" + os.environ["PATH"]})
+
+    def test_source_setup_script_with_shell_characters_in_path(self):
+        """Test that a setup script path is not expanded by the shell."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            script_dir = os.path.join(tmp_dir, 'dir "$HOME" `id`')
+            os.mkdir(script_dir)
+            setup_script = os.path.join(script_dir, "setup.sh")
+            with open(setup_script, "w") as f:
+                f.write("export SCHEDULER_TEST_SETUP=1\n")
+
+            env = _source_setup_script(setup_script)
+
+        self.assertEqual(env["SCHEDULER_TEST_SETUP"], "1")
+
+
+class TestSlurmRunner(unittest.TestCase):
+    """Tests for the SlurmRunner class."""
+
+    def test_check_status_batch_uses_one_squeue_call(self):
+        """Test that the status of several Slurm jobs is queried with a single squeue call."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            runner = SlurmRunner(config={"job_dir": tmp_dir})
+            script_path = os.path.join(tmp_dir, "run.sh")
+            open(script_path, "w").close()
+            jobs = []
+            for i in range(3):
+                job = Job(job_id=f"job_{i}", job_type=JobType.SCRIPT, script_path=script_path)
+                job.set_runner(runner)
+                job.state = JobState.RUNNING
+                runner.jobs[job.job_id] = str(100 + i)
+                jobs.append(job)
+
+            os.makedirs(os.path.join(tmp_dir, "job_1"))
+            with open(os.path.join(tmp_dir, "job_1", "result.json"), "w") as f:
+                f.write('{"objective": 1.0}')
+
+            squeue = mock.Mock(returncode=0, stdout="100\n102\n")
+            with mock.patch("scheduler.runners.slurm_runner.subprocess.run", return_value=squeue) as run:
+                states = runner.check_status_batch(jobs)
+
+            run.assert_called_once()
+            self.assertIn("--jobs=100,101,102", run.call_args[0][0])
+            self.assertEqual(
+                states, {"job_0": JobState.RUNNING, "job_1": JobState.COMPLETED, "job_2": JobState.RUNNING}
+            )
+            self.assertEqual(jobs[1].get_results(), {"objective": 1.0})
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -119,6 +119,36 @@ class TestTrial(unittest.TestCase):
         # Check that the status is correct
         self.assertEqual(status, TrialState.FAILED)
     
+    def test_check_status_cancelled(self):
+        """Test checking the status of a trial whose job was cancelled."""
+        trial = Trial("test_trial", {"param1": 1, "param2": 2})
+
+        job = MagicMock()
+        job.is_running.return_value = False
+        job.is_completed.return_value = False
+        job.has_failed.return_value = False
+        job.state = JobState.CANCELLED
+        trial.add_job(job)
+
+        status = trial.check_status()
+
+        self.assertEqual(status, TrialState.CANCELLED)
+
+    def test_update_state_does_not_poll_jobs(self):
+        """Test that updating the state uses the job states without checking the jobs."""
+        trial = Trial("test_trial", {"param1": 1, "param2": 2})
+
+        job = MagicMock()
+        job.is_running.return_value = False
+        job.is_completed.return_value = True
+        job.has_failed.return_value = False
+        trial.add_job(job)
+
+        status = trial.update_state()
+
+        self.assertEqual(status, TrialState.COMPLETED)
+        job.check_status.assert_not_called()
+
     def test_get_results(self):
         """Test getting results from a trial."""
         # Create a trial